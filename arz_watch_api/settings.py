@@ -181,6 +181,93 @@ REST_FRAMEWORK = {
     },
 }
 
+# ---------------------------------------------------------------
+# Scrapers Configuration
+# ---------------------------------------------------------------
+
+SCRAPER_AUTO_DRIVER = os.getenv("SCRAPER_AUTO_DRIVER", "False") == "True"
+SCRAPER_DRIVER_POOL_SIZE = int(os.getenv("SCRAPER_DRIVER_POOL_SIZE", 2))
+SCRAPER_DRIVER_MAX_PAGES = int(os.getenv("SCRAPER_DRIVER_MAX_PAGES", 50))
+SCRAPER_DRIVER_IDLE_TIMEOUT = int(
+    os.getenv("SCRAPER_DRIVER_IDLE_TIMEOUT", 900)
+)  # Seconds before an idle driver is quit
+SCRAPER_DRIVER_ACQUIRE_TIMEOUT = int(
+    os.getenv("SCRAPER_DRIVER_ACQUIRE_TIMEOUT", 60)
+)  # Seconds to wait for a free driver
+
+SCRAPER_HTTP_FIRST = os.getenv("SCRAPER_HTTP_FIRST", "True") == "True"
+SCRAPER_HTTP_POOL_SIZE = int(os.getenv("SCRAPER_HTTP_POOL_SIZE", 10))
+SCRAPER_HTTP_TIMEOUT = int(os.getenv("SCRAPER_HTTP_TIMEOUT", 10))
+
+SCRAPER_READY_MAX_WAIT = float(
+    os.getenv("SCRAPER_READY_MAX_WAIT", 5)
+)  # Upper bound in seconds for the page readiness wait
+SCRAPER_READY_MIN_QUIET = float(os.getenv("SCRAPER_READY_MIN_QUIET", 0.3))
+SCRAPER_READY_POLL_INTERVAL = float(os.getenv("SCRAPER_READY_POLL_INTERVAL", 0.1))
+
+SCRAPER_PARSER_BACKEND = os.getenv(
+    "SCRAPER_PARSER_BACKEND", "strainer"
+)  # One of: html.parser, strainer, lxml (requires lxml)
+
+SCRAPER_MARKET_MAX_PAGES = int(os.getenv("SCRAPER_MARKET_MAX_PAGES", 50))
+SCRAPER_MARKET_CONCURRENCY = int(
+    os.getenv("SCRAPER_MARKET_CONCURRENCY", 4)
+)  # Listing pages fetched at once in the full market crawl
+
+SCRAPER_SNAPSHOT_COMPACT = (
+    os.getenv("SCRAPER_SNAPSHOT_COMPACT", "True") == "True"
+)  # Compact JSON snapshots; False writes indented files
+SCRAPER_SNAPSHOT_STAT_INTERVAL = float(
+    os.getenv("SCRAPER_SNAPSHOT_STAT_INTERVAL", 1)
+)  # Seconds between snapshot file checks in the API views
+SCRAPER_PRESERIALIZED_RESPONSES = (
+    os.getenv("SCRAPER_PRESERIALIZED_RESPONSES", "True") == "True"
+)  # Render each snapshot's response body once per generation
+SCRAPER_COMPRESSED_RESPONSES = (
+    os.getenv("SCRAPER_COMPRESSED_RESPONSES", "True") == "True"
+)  # Precompress those bodies (gzip, and brotli when installed)
+
+SCRAPER_CHANGE_LOG_SIZE = int(
+    os.getenv("SCRAPER_CHANGE_LOG_SIZE", 50)
+)  # Scrapes kept per category for ?since= change requests
+
+SCRAPER_HISTORY_ENABLED = os.getenv("SCRAPER_HISTORY_ENABLED", "True") == "True"
+SCRAPER_HISTORY_RETENTION_DAYS = int(
+    os.getenv("SCRAPER_HISTORY_RETENTION_DAYS", 30)
+)  # Days of price history to keep; 0 keeps everything
+
+SCRAPER_CANDLES_ENABLED = os.getenv("SCRAPER_CANDLES_ENABLED", "True") == "True"
+SCRAPER_COLUMNAR_HISTORY_ENABLED = (
+    os.getenv("SCRAPER_COLUMNAR_HISTORY_ENABLED", "True") == "True"
+)  # Also append prices to memory-mapped segment files for analytics
+SCRAPER_COLUMNAR_HISTORY_DIR = Path(
+    os.getenv("SCRAPER_COLUMNAR_HISTORY_DIR", BASE_DIR / "scrapers_output" / "history")
+)
+
+SCRAPER_DERIVED_RATES_ENABLED = (
+    os.getenv("SCRAPER_DERIVED_RATES_ENABLED", "True") == "True"
+)
+SCRAPER_DERIVED_RATES = [
+    symbol.strip()
+    for symbol in os.getenv("SCRAPER_DERIVED_RATES", "").split(",")
+    if symbol.strip()
+]  # Derived rates to publish, e.g. USDT_PREMIUM,EMAMI_BUBBLE; empty for all
+
+SCRAPER_STREAM_POLL_INTERVAL = float(
+    os.getenv("SCRAPER_STREAM_POLL_INTERVAL", 1)
+)  # Seconds between snapshot checks behind the event streams
+SCRAPER_STREAM_HEARTBEAT = float(
+    os.getenv("SCRAPER_STREAM_HEARTBEAT", 15)
+)  # Seconds of silence before a stream sends a keep-alive comment
+
+SCRAPER_INTERVAL_MINUTES = int(
+    os.getenv("INTERVAL_TRIGGER_MINUTES", 10)
+)  # Minutes between scheduled scrapes; also bounds GET response freshness
+
+SCRAPER_MAX_WORKERS = int(
+    os.getenv("SCRAPER_MAX_WORKERS", 3)
+)  # Concurrent scrapes in parallel run mode
+
 
 EMAIL_BACKEND = os.getenv(
     "EMAIL_BACKEND", default="django.core.mail.backends.smtp.EmailBackend"
@@ -0,0 +1,2 @@
+from .price_point_admin import PricePointAdmin
+from .price_candle_admin import PriceCandleAdmin
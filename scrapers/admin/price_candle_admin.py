@@ -0,0 +1,20 @@
+from django.contrib import admin
+from scrapers.models import PriceCandle
+
+
+@admin.register(PriceCandle)
+class PriceCandleAdmin(admin.ModelAdmin):
+    list_display = (
+        "instrument",
+        "category",
+        "resolution",
+        "open_time",
+        "open",
+        "high",
+        "low",
+        "close",
+        "samples",
+    )
+    list_filter = ("resolution", "source", "category")
+    search_fields = ("instrument",)
+    ordering = ("-open_time",)
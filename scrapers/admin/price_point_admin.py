@@ -0,0 +1,24 @@
+from django.contrib import admin
+from scrapers.models import PricePoint
+
+
+@admin.register(PricePoint)
+class PricePointAdmin(admin.ModelAdmin):
+    list_display = (
+        "instrument",
+        "category",
+        "source",
+        "generation",
+        "timestamp",
+    )
+    list_filter = ("source", "category")
+    search_fields = ("instrument",)
+    readonly_fields = (
+        "source",
+        "category",
+        "instrument",
+        "generation",
+        "timestamp",
+        "values",
+    )
+    ordering = ("-timestamp",)
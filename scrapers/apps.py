@@ -6,4 +6,23 @@ class ScrapersConfig(AppConfig):
     name = "scrapers"
 
     def ready(self):
-        pass
+        from scrapers.signals import snapshot_published
+        from scrapers.modules.history import (
+            append_columnar_history,
+            record_price_history,
+            update_candles,
+        )
+        from scrapers.modules.derived import publish_derived_rates
+
+        snapshot_published.connect(
+            record_price_history, dispatch_uid="scrapers.record_price_history"
+        )
+        snapshot_published.connect(
+            update_candles, dispatch_uid="scrapers.update_candles"
+        )
+        snapshot_published.connect(
+            append_columnar_history, dispatch_uid="scrapers.append_columnar_history"
+        )
+        snapshot_published.connect(
+            publish_derived_rates, dispatch_uid="scrapers.publish_derived_rates"
+        )
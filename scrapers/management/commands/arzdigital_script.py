@@ -1,10 +1,14 @@
 from scrapers.modules.arzdigital import ArzDigitalScraperManager
 
 
-def run_scraper(crypto=True, save=True):
+def run_scraper(crypto=True, market=False, save=True, parallel=False, max_workers=None):
     scraper_manager = ArzDigitalScraperManager()
 
     scraper_manager.run(
         crypto=crypto,
+        market=market,
         save=save,
+        parallel=parallel,
+        max_workers=max_workers,
     )
+    return scraper_manager.errors
@@ -1,5 +1,5 @@
 from .arzdigital_script import run_scraper
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
 
 
 class Command(BaseCommand):
@@ -12,20 +12,52 @@ class Command(BaseCommand):
             help="Scrape crypto data only",
         )
 
+        parser.add_argument(
+            "--market",
+            action="store_true",
+            help="Crawl every coin listing page (full market)",
+        )
+
         parser.add_argument(
             "--save",
             action="store_true",
             help="Save data to file",
         )
 
+        parser.add_argument(
+            "--parallel",
+            action="store_true",
+            help="Scrape the selected categories concurrently",
+        )
+
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=None,
+            help="Maximum number of concurrent scrapes (defaults to SCRAPER_MAX_WORKERS)",
+        )
+
     def handle(self, *args, **kwargs):
         crypto = kwargs["crypto"]
+        market = kwargs["market"]
         save = kwargs["save"]
+        parallel = kwargs["parallel"]
+        max_workers = kwargs["workers"]
 
         # Run the scraper with the provided arguments
-        run_scraper(
+        errors = run_scraper(
             crypto=crypto,
+            market=market,
             save=save,
+            parallel=parallel,
+            max_workers=max_workers,
         )
 
+        for category, error in errors.items():
+            self.stderr.write(self.style.ERROR(f"{category}: {error}"))
+        if errors:
+            raise CommandError(
+                f"The ArzDigital scraper failed for: {', '.join(errors)}"
+            )
+
         self.stdout.write(self.style.SUCCESS("Successfully ran the ArzDigital scraper"))
@@ -1,5 +1,5 @@
 from .tgju_script import run_scraper
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
 
 
 class Command(BaseCommand):
@@ -30,17 +30,39 @@ class Command(BaseCommand):
             help="Saves data to file",
         )
 
+        parser.add_argument(
+            "--parallel",
+            action="store_true",
+            help="Scrape the selected categories concurrently",
+        )
+
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=None,
+            help="Maximum number of concurrent scrapes (defaults to SCRAPER_MAX_WORKERS)",
+        )
+
     def handle(self, *args, **kwargs):
         coins = kwargs["coins"]
         gold = kwargs["gold"]
         currency = kwargs["currency"]
         save = kwargs["save"]
+        parallel = kwargs["parallel"]
+        max_workers = kwargs["workers"]
 
         # Run the scraper with the provided arguments
-        run_scraper(
+        errors = run_scraper(
             coins=coins,
             gold=gold,
             currency=currency,
             save=save,
+            parallel=parallel,
+            max_workers=max_workers,
         )
+        for category, error in errors.items():
+            self.stderr.write(self.style.ERROR(f"{category}: {error}"))
+        if errors:
+            raise CommandError(f"The TGJU scraper failed for: {', '.join(errors)}")
+
         self.stdout.write(self.style.SUCCESS("Successfully ran the TGJU scraper"))
@@ -2,11 +2,14 @@ import os
 import signal
 import logging
 from dotenv import load_dotenv
+from django.conf import settings
 from django.core.management import call_command
 from django.core.management.base import BaseCommand
 from apscheduler.triggers.interval import IntervalTrigger
 from apscheduler.schedulers.blocking import BlockingScheduler
 
+from scrapers.modules.runner import ScraperRunner
+
 # Load environment variables
 load_dotenv()
 
@@ -16,7 +19,7 @@ logging.basicConfig(level=logging.INFO)
 
 # Configs from .env
 initial_run = os.getenv("INITIAL_RUN", "False") == "True"
-interval_trigger_minutes = int(os.getenv("INTERVAL_TRIGGER_MINUTES", 10))
+interval_trigger_minutes = settings.SCRAPER_INTERVAL_MINUTES
 
 
 class Command(BaseCommand):
@@ -42,24 +45,34 @@ class Command(BaseCommand):
                     "gold": True,
                     "currency": True,
                     "save": True,
+                    "parallel": True,
                 },
                 "id": "tgju_scraper",
             },
             {
                 "command": "run_arzdigital_scraper",
-                "kwargs": {"crypto": True, "save": True},
+                "kwargs": {"crypto": True, "save": True, "parallel": True},
                 "id": "arzdigital_scraper",
             },
         ]
 
-        for scraper in scrapers:
-            if initial_run:
-                try:
-                    logger.info(f"Running initial: {scraper['command']}")
-                    call_command(scraper["command"], **scraper["kwargs"])
-                except Exception as e:
-                    logger.error(f"Initial run error for {scraper['command']}: {e}")
+        if initial_run:
+            # Run every scraper's initial pass concurrently
+            logger.info("Running initial scrapes...")
+            report = ScraperRunner().run(
+                {
+                    scraper["command"]: (
+                        lambda c=scraper["command"], k=scraper["kwargs"]: call_command(
+                            c, **k
+                        )
+                    )
+                    for scraper in scrapers
+                }
+            )
+            for command, error in report.errors.items():
+                logger.error(f"Initial run error for {command}: {error}")
 
+        for scraper in scrapers:
             scheduler.add_job(
                 lambda c=scraper["command"], k=scraper["kwargs"]: call_command(c, **k),
                 trigger=IntervalTrigger(minutes=interval_trigger_minutes),
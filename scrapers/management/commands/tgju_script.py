@@ -1,7 +1,9 @@
 from scrapers.modules.tgju import TGJUScraperManager
 
 
-def run_scraper(coins=True, gold=True, currency=True, save=True):
+def run_scraper(
+    coins=True, gold=True, currency=True, save=True, parallel=False, max_workers=None
+):
     scraper_manager = TGJUScraperManager()
 
     scraper_manager.run(
@@ -9,4 +11,7 @@ def run_scraper(coins=True, gold=True, currency=True, save=True):
         gold=gold,
         currency=currency,
         save=save,
+        parallel=parallel,
+        max_workers=max_workers,
     )
+    return scraper_manager.errors
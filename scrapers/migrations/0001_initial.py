@@ -0,0 +1,52 @@
+# Generated by Django 5.2 on 2026-10-18 12:13
+
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="PricePoint",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("source", models.CharField(max_length=20)),
+                ("category", models.CharField(max_length=20)),
+                ("instrument", models.CharField(max_length=100)),
+                ("generation", models.PositiveIntegerField()),
+                ("timestamp", models.DateTimeField()),
+                ("values", models.JSONField()),
+            ],
+            options={
+                "verbose_name": "Price Point",
+                "verbose_name_plural": "Price Points",
+                "ordering": ["-timestamp"],
+                "indexes": [
+                    models.Index(
+                        fields=["instrument", "timestamp"],
+                        name="scrapers_pr_instrum_6d2004_idx",
+                    ),
+                    models.Index(
+                        fields=["category", "timestamp"],
+                        name="scrapers_pr_categor_d3566b_idx",
+                    ),
+                    models.Index(
+                        fields=["timestamp"], name="scrapers_pr_timesta_e7594e_idx"
+                    ),
+                ],
+            },
+        ),
+    ]
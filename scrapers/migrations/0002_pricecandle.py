@@ -0,0 +1,60 @@
+# Generated by Django 5.2 on 2026-10-18 12:15
+
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("scrapers", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PriceCandle",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("source", models.CharField(max_length=20)),
+                ("category", models.CharField(max_length=20)),
+                ("instrument", models.CharField(max_length=100)),
+                (
+                    "resolution",
+                    models.CharField(
+                        choices=[
+                            ("1m", "1 minute"),
+                            ("15m", "15 minutes"),
+                            ("1h", "1 hour"),
+                            ("1d", "1 day"),
+                        ],
+                        max_length=3,
+                    ),
+                ),
+                ("open_time", models.DateTimeField()),
+                ("open", models.DecimalField(decimal_places=8, max_digits=28)),
+                ("high", models.DecimalField(decimal_places=8, max_digits=28)),
+                ("low", models.DecimalField(decimal_places=8, max_digits=28)),
+                ("close", models.DecimalField(decimal_places=8, max_digits=28)),
+                ("samples", models.PositiveIntegerField(default=1)),
+            ],
+            options={
+                "verbose_name": "Price Candle",
+                "verbose_name_plural": "Price Candles",
+                "ordering": ["-open_time"],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("category", "instrument", "resolution", "open_time"),
+                        name="unique_price_candle",
+                    )
+                ],
+            },
+        ),
+    ]
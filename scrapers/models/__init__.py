@@ -0,0 +1,2 @@
+from .price_point_model import PricePoint
+from .price_candle_model import PriceCandle
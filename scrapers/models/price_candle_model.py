@@ -0,0 +1,56 @@
+import uuid
+from datetime import timedelta
+from django.db import models
+from django.utils import timezone
+
+
+class PriceCandle(models.Model):
+    """Open/high/low/close of one instrument over one time bucket."""
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+
+    RESOLUTIONS = [
+        ("1m", "1 minute"),
+        ("15m", "15 minutes"),
+        ("1h", "1 hour"),
+        ("1d", "1 day"),
+    ]
+
+    RESOLUTION_SECONDS = {"1m": 60, "15m": 900, "1h": 3600, "1d": 86400}
+
+    source = models.CharField(max_length=20)
+    category = models.CharField(max_length=20)
+    instrument = models.CharField(max_length=100)
+    resolution = models.CharField(max_length=3, choices=RESOLUTIONS)
+
+    open_time = models.DateTimeField()
+
+    open = models.DecimalField(max_digits=28, decimal_places=8)
+    high = models.DecimalField(max_digits=28, decimal_places=8)
+    low = models.DecimalField(max_digits=28, decimal_places=8)
+    close = models.DecimalField(max_digits=28, decimal_places=8)
+    samples = models.PositiveIntegerField(default=1)
+
+    class Meta:
+        verbose_name = "Price Candle"
+        verbose_name_plural = "Price Candles"
+        ordering = ["-open_time"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["category", "instrument", "resolution", "open_time"],
+                name="unique_price_candle",
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.category}/{self.instrument} {self.resolution} @ {self.open_time:%Y-%m-%d %H:%M}"
+
+    @property
+    def close_time(self):
+        return self.open_time + timedelta(
+            seconds=self.RESOLUTION_SECONDS[self.resolution]
+        )
+
+    @property
+    def is_closed(self) -> bool:
+        return timezone.now() >= self.close_time
@@ -0,0 +1,30 @@
+import uuid
+from django.db import models
+
+
+class PricePoint(models.Model):
+    """One instrument's values as published by one scrape."""
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+
+    source = models.CharField(max_length=20)
+    category = models.CharField(max_length=20)
+    instrument = models.CharField(max_length=100)
+
+    generation = models.PositiveIntegerField()
+    timestamp = models.DateTimeField()
+
+    values = models.JSONField()
+
+    class Meta:
+        verbose_name = "Price Point"
+        verbose_name_plural = "Price Points"
+        ordering = ["-timestamp"]
+        indexes = [
+            models.Index(fields=["instrument", "timestamp"]),
+            models.Index(fields=["category", "timestamp"]),
+            models.Index(fields=["timestamp"]),
+        ]
+
+    def __str__(self):
+        return f"{self.category}/{self.instrument} @ {self.timestamp:%Y-%m-%d %H:%M}"
@@ -1,3 +1,4 @@
 from .base import ArzDigitalBaseScraper
 from .crypto import ArzDigitalCryptoScraper
+from .market import ArzDigitalMarketScraper
 from .manager import ArzDigitalScraperManager
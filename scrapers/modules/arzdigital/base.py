@@ -1,49 +1,67 @@
-import time
 import json
-import platform
+import hashlib
 from selenium import webdriver
 from django.conf import settings
 from typing import Any, Generator
-from bs4 import BeautifulSoup, Tag
+from bs4 import Tag
 from abc import ABC, abstractmethod
 from contextlib import contextmanager
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import WebDriverWait
-from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, WebDriverException
 
+from scrapers.modules.fetcher import HttpFetcher
+from scrapers.modules.parsers import get_row_parser
+from scrapers.modules.driver_pool import ChromeDriverPool
+from scrapers.modules.readiness import (
+    PageReadinessWaiter,
+    RowCountStrategy,
+    MutationQuiescenceStrategy,
+)
+
 
 class ArzDigitalBaseScraper(ABC):
     """Abstract base class for scraping crypto data from ArzDigital website."""
 
-    _platform = platform.system()
+    ROW_ATTRS = {"class": "arz-coin-tr"}
+
+    # Raw text found in every row tag, used to hash the table before parsing
+    ROW_MARKER = "arz-coin-tr"
+
+    # (scraper, url) -> (content hash, parsed rows), shared within the process
+    _parsed_pages: dict[tuple[str, str], tuple[str, list[dict[str, Any]]]] = {}
 
-    def __init__(self, url: str, logger, scraper_type: str, timeout: int = 10):
+    # Parser backend used for row extraction; None uses SCRAPER_PARSER_BACKEND
+    parser_backend = None
+
+    def __init__(
+        self,
+        url: str,
+        logger,
+        scraper_type: str,
+        timeout: int = 10,
+        parser_backend: str | None = None,
+    ):
         self.url = url
-        self.driver = None
+        self.last_wait = None
         self.logger = logger
         self.timeout = timeout
         self.scraper_type = scraper_type
+        self.row_parser = get_row_parser(
+            parser_backend or self.parser_backend or settings.SCRAPER_PARSER_BACKEND
+        )
 
     def fetch_data(self, pretty: bool = False) -> list[dict[str, Any]] | None:
         self.logger.info(f"Fetching {self.scraper_type} data from ArzDigital...")
 
         try:
-            with self._get_driver() as driver:
-                self.driver = driver
-                page_content = self._load_page()
-                rows = self._extract_rows(page_content)
-                data = self._process_rows(rows)
-
-                self.logger.info(
-                    f"{self.scraper_type} data successfully scraped from ArzDigital."
-                )
-                return (
-                    json.dumps(data, ensure_ascii=False, indent=4) if pretty else data
-                )
+            data = self._scrape()
+
+            self.logger.info(
+                f"{self.scraper_type} data successfully scraped from ArzDigital."
+            )
+            return json.dumps(data, ensure_ascii=False, indent=4) if pretty else data
 
         except TimeoutException:
             self.logger.warning("Page load timed out.")
@@ -53,51 +71,103 @@ class ArzDigitalBaseScraper(ABC):
             self.logger.exception(f"Unexpected error: {str(e)}")
         return None
 
-    @contextmanager
-    def _get_driver(
-        self, auto_driver: bool = False
-    ) -> Generator[webdriver.Chrome, None, None]:
-        """Get a new Chrome driver instance."""
-        # Initialize the driver path based on the platform
-        linux_path = (
-            settings.BASE_DIR / "scrapers/drivers/chrome_driver_linux/chromedriver"
-        )
-        windows_path = (
-            settings.BASE_DIR
-            / "scrapers/drivers/chrome_driver_windows/chromedriver.exe"
-        )
+    def _scrape(
+        self, url: str | None = None, static_content: str | None = None
+    ) -> list[dict[str, Any]]:
+        """
+        Scrape over plain HTTP first, falling back to Selenium if rows are missing.
+
+        ``static_content`` is the page already fetched over HTTP by the caller
+        (empty if that fetch failed), so it is not requested a second time.
+        """
+        url = url or self.url
+
+        if settings.SCRAPER_HTTP_FIRST:
+            page_content = (
+                self._fetch_static_page(url)
+                if static_content is None
+                else static_content
+            )
+            if page_content:
+                data = self._parse_page(page_content, url)
+                if data:
+                    self.logger.info(f"{self.scraper_type} rows read from static HTML.")
+                    return data
+
+            self.logger.info(
+                f"{self.scraper_type} rows missing from static HTML, using Selenium."
+            )
+
+        with self._get_driver() as driver:
+            page_content = self._load_page(driver, url)
+
+        return self._parse_page(page_content, url)
+
+    def _parse_page(self, content: str, url: str) -> list[dict[str, Any]]:
+        """Parse the page's rows unless they are identical to the last parse."""
+        digest = self._content_hash(content)
+        cache_key = (type(self).__name__, url)
+        cached = self._parsed_pages.get(cache_key)
+
+        if digest is not None and cached is not None and cached[0] == digest:
+            self.logger.info(f"{self.scraper_type} table unchanged, skipping parse.")
+            return cached[1]
+
+        data = self._process_rows(self._extract_rows(content))
+        if data and digest is not None:
+            self._parsed_pages[cache_key] = (digest, data)
+        return data
+
+    def _content_hash(self, content: str) -> str | None:
+        """
+        Hash the raw HTML from the first to the last row, before any parsing,
+        so the hash covers every row; None when the page has no rows, which
+        never matches a previous parse.
+        """
+        first = content.find(self.ROW_MARKER)
+        if first == -1:
+            return None
+
+        start = max(content.rfind("<", 0, first), 0)
+        end = content.find("</tr>", content.rfind(self.ROW_MARKER))
+        end = len(content) if end == -1 else end + len("</tr>")
+        return hashlib.sha256(content[start:end].encode("utf-8")).hexdigest()
+
+    def _fetch_static_page(self, url: str) -> str | None:
+        return HttpFetcher.instance().get_text(url)
 
-        driver_path = windows_path if self._platform == "Windows" else linux_path
-
-        # Initialize the service based on the auto_driver flag
-        service = (
-            Service(driver_path)
-            if not auto_driver
-            else Service(ChromeDriverManager().install())
-        )
-
-        options = Options()
-        options.add_argument("--headless")
-        options.add_argument("--disable-gpu")
-        options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64)")
-        driver = webdriver.Chrome(service=service, options=options)
-
-        try:
+    @contextmanager
+    def _get_driver(self) -> Generator[webdriver.Chrome, None, None]:
+        """Borrow a Chrome driver from the shared driver pool."""
+        with ChromeDriverPool.instance().driver() as driver:
             yield driver
-        finally:
-            driver.quit()
 
-    def _load_page(self) -> str:
-        self.driver.get(self.url)
-        WebDriverWait(self.driver, self.timeout).until(
+    def _load_page(self, driver: webdriver.Chrome, url: str) -> str:
+        driver.get(url)
+        WebDriverWait(driver, self.timeout).until(
             EC.presence_of_element_located((By.CSS_SELECTOR, "tr.arz-coin-tr"))
         )
-        time.sleep(5)  # wait for the page to fully load (you can adjust this)
-        return self.driver.page_source
+        self.last_wait = self._get_readiness_waiter().wait(driver)
+        self.logger.info(
+            f"{self.scraper_type} page ready after {self.last_wait.elapsed:.2f}s "
+            f"({'settled' if self.last_wait.settled else 'upper bound reached'})."
+        )
+        return driver.page_source
+
+    def _get_readiness_waiter(self) -> PageReadinessWaiter:
+        return PageReadinessWaiter(
+            site=self.url,
+            strategies=[
+                RowCountStrategy("tr.arz-coin-tr"),
+                MutationQuiescenceStrategy(),
+            ],
+            max_wait=settings.SCRAPER_READY_MAX_WAIT,
+            min_quiet=settings.SCRAPER_READY_MIN_QUIET,
+            poll_interval=settings.SCRAPER_READY_POLL_INTERVAL,
+        )
 
     def _extract_rows(self, content: str) -> list[Tag]:
-        soup = BeautifulSoup(content, "html.parser")
-        return soup.find_all("tr", class_="arz-coin-tr")
+        return self.row_parser.extract_rows(content, self.ROW_ATTRS)
 
     @abstractmethod
     def _process_rows(self, rows: list[Tag]) -> list[dict[str, str]]:
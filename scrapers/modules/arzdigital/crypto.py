@@ -1,22 +1,34 @@
 from bs4 import Tag
 from datetime import datetime, timezone
+from .plan import ExtractionPlan
 from .base import ArzDigitalBaseScraper
-from datetime import datetime, timezone
 from scrapers.modules.logger import LoggerFactory
+from scrapers.modules.normalize import PERSIAN_DIGITS_TABLE
 
 
 class ArzDigitalCryptoScraper(ArzDigitalBaseScraper):
-    TARGET_NAMES = {
-        "Bitcoin": "بیت‌کوین",
-        "Ethereum": "اتریوم",
+    # data-symbol of each scraped coin and its Persian name; rows are accepted
+    # or rejected on data-symbol before any field is extracted
+    TARGET_SYMBOLS = {
+        "BTC": "بیت‌کوین",
+        "ETH": "اتریوم",
         "XRP": "ریپل",
-        "Solana": "سولانا",
-        "Dogecoin": "دوج‌کوین",
-        "Cardano": "کاردانو",
-        "TRON": "ترون",
-        "Toncoin": "تون‌کوین",
-        "Litecoin": "لایت‌کوین",
-        "Tether USDt": "تتر",
+        "SOL": "سولانا",
+        "DOGE": "دوج‌کوین",
+        "ADA": "کاردانو",
+        "TRX": "ترون",
+        "TON": "تون‌کوین",
+        "LTC": "لایت‌کوین",
+        "USDT": "تتر",
+    }
+
+    FIELD_SELECTORS = {
+        "name": "td.arz-coin-table__name-td span",
+        "price_usd": "td.arz-coin-table__price-td span",
+        "price_irr": "td.arz-coin-table__rial-price-td span",
+        "market_cap": "td.arz-coin-table__marketcap-td span[dir='auto']",
+        "change_24h": "td.arz-coin-table__daily-swing-td span",
+        # "change_7d": "td.arz-coin-table__weekly-swing-td span",
     }
 
     def __init__(self):
@@ -27,69 +39,57 @@ class ArzDigitalCryptoScraper(ArzDigitalBaseScraper):
                 "ArzDigitalCryptoScraper", "scrapers/arzdigital/crypto"
             ),
         )
+        self.plan = self._build_plan()
+
+    def _build_plan(self) -> ExtractionPlan:
+        return ExtractionPlan(self.FIELD_SELECTORS, symbols=self.TARGET_SYMBOLS)
 
     def _process_rows(self, rows: list[Tag]) -> list[dict[str, str]]:
         crypto_data = []
         last_update = datetime.now(timezone.utc).isoformat()
 
         for row in rows:
-            try:
-                name = row.select_one("td.arz-coin-table__name-td span").text.strip()
-
-                if name not in self.TARGET_NAMES:
-                    continue
-
-                symbol = row["data-symbol"]
-
-                price_usd = row.select_one(
-                    "td.arz-coin-table__price-td span"
-                ).text.strip()
-
-                price_irr_str = row.select_one(
-                    "td.arz-coin-table__rial-price-td span"
-                ).text.strip()
-
-                price_irr = self._parse_price_irt(price_irr_str)
+            if not self.plan.accepts(row):
+                continue
 
-                marketcap = row.select_one(
-                    "td.arz-coin-table__marketcap-td span[dir='auto']"
-                ).text.strip()
+            try:
+                crypto_data.append(self._parse_row(row, last_update))
+            except Exception:
+                continue
 
-                daily_change_elem = row.select_one(
-                    "td.arz-coin-table__daily-swing-td span"
-                )
+        return crypto_data
 
-                daily_change_text = daily_change_elem.text.strip()
-                if "arz-negative" in daily_change_elem.get("class", []):
-                    if not daily_change_text.startswith("-"):
-                        daily_change_text = f"-{daily_change_text}"
+    def _parse_row(self, row: Tag, last_update: str) -> dict[str, str]:
+        plan = self.plan
 
-                # weekly_change = row.select_one(
-                #     "td.arz-coin-table__weekly-swing-td span"
-                # ).text.strip()
+        symbol = row["data-symbol"]
+        name = plan.text(row, "name")
 
-                coin = {
-                    "name": name,
-                    "name_fa": self.TARGET_NAMES[name],
-                    "symbol": symbol,
-                    "price_usd": price_usd,
-                    "price_irr": price_irr,
-                    "market_cap": marketcap,
-                    "change_24h": daily_change_text,
-                    "last_update": last_update,
-                }
+        daily_change_elem = plan.element(row, "change_24h")
+        daily_change_text = daily_change_elem.text.strip()
+        if "arz-negative" in daily_change_elem.get("class", []):
+            if not daily_change_text.startswith("-"):
+                daily_change_text = f"-{daily_change_text}"
 
-                crypto_data.append(coin)
+        return {
+            "name": name,
+            "name_fa": self._get_name_fa(symbol, name),
+            "symbol": symbol,
+            "price_usd": plan.text(row, "price_usd"),
+            "price_irr": self._parse_price_irt(plan.text(row, "price_irr")),
+            "market_cap": plan.text(row, "market_cap"),
+            "change_24h": daily_change_text,
+            "last_update": last_update,
+        }
 
-            except Exception as e:
-                continue
-        return crypto_data
+    def _get_name_fa(self, symbol: str, name: str) -> str:
+        return self.TARGET_SYMBOLS[symbol]
 
     def _parse_price_irt(self, price_str: str) -> str:
-        persian_digits = "۰۱۲۳۴۵۶۷۸۹"
-        english_digits = "0123456789"
-        trans_table = str.maketrans("".join(persian_digits), "".join(english_digits))
         clean_str = (
-            price_str.translate(trans_table).replace(",", "").replace("ت", "").strip()
+            price_str.translate(PERSIAN_DIGITS_TABLE)
+            .replace(",", "")
+            .replace("ت", "")
+            .strip()
         )
         return str(int(clean_str) * 10)
@@ -1,7 +1,8 @@
-import os
-import json
 from django.conf import settings
 from .crypto import ArzDigitalCryptoScraper
+from .market import ArzDigitalMarketScraper
+from scrapers.modules.runner import ScraperRunner
+from scrapers.modules.snapshots import publish_snapshot
 
 SCRAPERS_OUTPUT_DIR = settings.BASE_DIR / "scrapers_output" / "arzdigital"
 
@@ -9,30 +10,61 @@ SCRAPERS_OUTPUT_DIR = settings.BASE_DIR / "scrapers_output" / "arzdigital"
 class ArzDigitalScraperManager:
     def __init__(self):
         self.crypto_scraper = ArzDigitalCryptoScraper()
+        self.market_scraper = ArzDigitalMarketScraper()
+        self.errors = {}
 
-    def _save_to_file(self, data, filename: str):
-        """Internal method to save data to a JSON file."""
-        if data:
-            path = SCRAPERS_OUTPUT_DIR / filename
-            os.makedirs(path.parent, exist_ok=True)
-            with open(path, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=4)
+    def _publish(self, data, category: str):
+        """Publish a category if at least one instrument changed since the last save."""
+        return publish_snapshot(
+            SCRAPERS_OUTPUT_DIR,
+            "arzdigital",
+            category,
+            data,
+            key="symbol",
+            sender=self.__class__,
+        )
+
+    def _fetch(self, scraper):
+        """Scrape with ``scraper``, raising on failure so the runner reports it."""
+        data = scraper.fetch_data()
+        if data is None:
+            raise RuntimeError(f"{scraper.scraper_type} scrape failed")
+        return data
 
     def get_crypto_data(self, save: bool = True):
-        data = self.crypto_scraper.fetch_data()
+        data = self._fetch(self.crypto_scraper)
         if save:
-            self._save_to_file(data, "crypto.json")
+            self._publish(data, "crypto")
         else:
             return data
 
-    def run(self, crypto=False, save=True):
-        """Run the selected scrapers. If no specific flag is given, scrape all."""
-        results = {}
-
-        if not crypto:
-            results["crypto"] = self.get_crypto_data(save=save)
+    def get_market_data(self, save: bool = True):
+        data = self._fetch(self.market_scraper)
+        if save:
+            self._publish(data, "market")
         else:
-            if crypto:
-                results["crypto"] = self.get_crypto_data(save=save)
+            return data
+
+    def run(
+        self, crypto=False, market=False, save=True, parallel=False, max_workers=None
+    ):
+        """
+        Run the selected scrapers. If no specific flag is given, scrape crypto.
+
+        With ``parallel`` the categories are scraped concurrently on up to
+        ``max_workers`` threads; per-category failures are kept in ``self.errors``.
+        """
+        # The full market crawl is only run when asked for explicitly
+        if not (crypto or market):
+            crypto = True
+
+        tasks = {}
+        if crypto:
+            tasks["crypto"] = lambda: self.get_crypto_data(save=save)
+
+        if market:
+            tasks["market"] = lambda: self.get_market_data(save=save)
 
-        return results
+        report = ScraperRunner(max_workers=max_workers).run(tasks, parallel=parallel)
+        self.errors = report.errors
+        return report.results
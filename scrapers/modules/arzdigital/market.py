@@ -0,0 +1,97 @@
+import re
+import json
+from typing import Any, Iterator
+from django.conf import settings
+from concurrent.futures import ThreadPoolExecutor
+
+from .plan import ExtractionPlan
+from .crypto import ArzDigitalCryptoScraper
+from scrapers.modules.logger import LoggerFactory
+
+PAGE_LINK_PATTERN = re.compile(r"/coins/page-(\d+)/?")
+
+
+class ArzDigitalMarketScraper(ArzDigitalCryptoScraper):
+    """
+    Crawls every listing page of https://arzdigital.com/coins/ ("full market").
+
+    Pages after the first are fetched concurrently in windows of
+    ``concurrency`` pages through the shared HTTP session and driver pool.
+    Each page is parsed and dropped inside its worker, and rows are yielded
+    de-duplicated by ``data-symbol`` as the pages complete.
+    """
+
+    PAGE_URL = "https://arzdigital.com/coins/page-{page}/"
+
+    def __init__(self, max_pages: int | None = None, concurrency: int | None = None):
+        super().__init__()
+        self.scraper_type = "Market"
+        self.logger = LoggerFactory.get_logger(
+            "ArzDigitalMarketScraper", "scrapers/arzdigital/market"
+        )
+        self.max_pages = max_pages or settings.SCRAPER_MARKET_MAX_PAGES
+        self.concurrency = concurrency or settings.SCRAPER_MARKET_CONCURRENCY
+        self.last_page = None
+
+    def _build_plan(self) -> ExtractionPlan:
+        # No symbol filter: every coin on every page is kept
+        return ExtractionPlan(self.FIELD_SELECTORS)
+
+    def _get_name_fa(self, symbol: str, name: str) -> str:
+        return self.TARGET_SYMBOLS.get(symbol, name)
+
+    def fetch_data(self, pretty: bool = False) -> list[dict[str, Any]] | None:
+        self.logger.info("Fetching full market data from ArzDigital...")
+
+        try:
+            data = list(self.iter_rows())
+            self.logger.info(f"{len(data)} coins scraped from ArzDigital.")
+            return json.dumps(data, ensure_ascii=False, indent=4) if pretty else data
+        except Exception as e:
+            self.logger.exception(f"Unexpected error: {str(e)}")
+        return None
+
+    def iter_rows(self) -> Iterator[dict[str, Any]]:
+        """Yield each coin of the full market once, page by page."""
+        seen = set()
+
+        for rows in self._iter_pages():
+            for row in rows:
+                if row["symbol"] in seen:
+                    continue
+                seen.add(row["symbol"])
+                yield row
+
+    def _iter_pages(self) -> Iterator[list[dict[str, Any]]]:
+        first_page = self._fetch_static_page(self.url) or ""
+        self.last_page = self._find_last_page(first_page)
+        yield self._scrape(self.url, static_content=first_page)
+
+        last_page = min(self.last_page or self.max_pages, self.max_pages)
+        pages = list(range(2, last_page + 1))
+
+        with ThreadPoolExecutor(
+            max_workers=self.concurrency, thread_name_prefix="arzdigital-page"
+        ) as executor:
+            for start in range(0, len(pages), self.concurrency):
+                window = pages[start : start + self.concurrency]
+                found = False
+
+                for rows in executor.map(self._scrape_page, window):
+                    found = found or bool(rows)
+                    yield rows
+
+                # Without a known last page, stop at the first empty window
+                if not found and self.last_page is None:
+                    break
+
+    def _scrape_page(self, page: int) -> list[dict[str, Any]]:
+        try:
+            return self._scrape(self.PAGE_URL.format(page=page))
+        except Exception as e:
+            self.logger.warning(f"Failed to scrape market page {page}: {str(e)}")
+            return []
+
+    def _find_last_page(self, content: str) -> int | None:
+        pages = [int(page) for page in PAGE_LINK_PATTERN.findall(content)]
+        return max(pages) if pages else None
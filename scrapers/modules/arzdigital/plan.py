@@ -0,0 +1,28 @@
+import soupsieve as sv
+from bs4 import Tag
+from typing import Iterable
+
+
+class ExtractionPlan:
+    """
+    Precompiled description of which coin rows to keep and where their fields are.
+
+    Rows are accepted or rejected on their ``data-symbol`` attribute before any
+    cell is looked at, and field selectors are compiled once per plan instead of
+    being parsed again for every row.
+    """
+
+    def __init__(self, selectors: dict[str, str], symbols: Iterable[str] | None = None):
+        self.symbols = frozenset(symbols) if symbols is not None else None
+        self.selectors = {
+            field: sv.compile(selector) for field, selector in selectors.items()
+        }
+
+    def accepts(self, row: Tag) -> bool:
+        return self.symbols is None or row.get("data-symbol") in self.symbols
+
+    def element(self, row: Tag, field: str) -> Tag | None:
+        return self.selectors[field].select_one(row)
+
+    def text(self, row: Tag, field: str) -> str:
+        return self.element(row, field).text.strip()
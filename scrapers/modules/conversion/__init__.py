@@ -0,0 +1,3 @@
+from .matrix import BASE_UNITS, CONVERSION_SOURCES, RateMatrix, RateMatrixCache
+
+__all__ = ["BASE_UNITS", "CONVERSION_SOURCES", "RateMatrix", "RateMatrixCache"]
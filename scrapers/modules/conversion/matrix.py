@@ -0,0 +1,93 @@
+import threading
+import numpy as np
+from typing import Any, Hashable
+
+from scrapers.modules.normalize import numeric_value
+
+# Rial value of the units that are not scraped
+BASE_UNITS = {"IRR": 1, "IRT": 10}
+
+# Snapshots priced in rials: (source, category, key field, rial price field)
+CONVERSION_SOURCES = (
+    ("tgju", "currency", "title", "price"),
+    ("arzdigital", "crypto", "symbol", "price_irr"),
+)
+
+
+class RateMatrix:
+    """
+    Pairwise conversion rates between every priced instrument.
+
+    ``rates[i, j]`` is how many units of instrument ``j`` one unit of
+    instrument ``i`` is worth, computed once from the rial prices as an outer
+    division, so a conversion is an index lookup and a multiplication.
+    Instruments are matched case-insensitively.
+    """
+
+    def __init__(self, values: dict[str, float]):
+        self.instruments = list(values)
+        self.index = {
+            instrument.strip().casefold(): position
+            for position, instrument in enumerate(self.instruments)
+        }
+        prices = np.array(list(values.values()), dtype=np.float64)
+        self.rates = np.divide.outer(prices, prices)
+
+    @classmethod
+    def from_snapshots(
+        cls, snapshots: dict[tuple[str, str], list[dict[str, Any]]]
+    ) -> "RateMatrix":
+        """Build the matrix from the rows of the ``CONVERSION_SOURCES`` snapshots."""
+        values = dict(BASE_UNITS)
+        for source, category, key, field in CONVERSION_SOURCES:
+            for row in snapshots.get((source, category)) or []:
+                price = numeric_value(row, field)
+                if price:
+                    values[row[key]] = float(price)
+        return cls(values)
+
+    def position(self, instrument: str) -> int | None:
+        return self.index.get(instrument.strip().casefold())
+
+    def rate(self, base: str, quote: str) -> float | None:
+        """Units of ``quote`` that one unit of ``base`` is worth."""
+        i, j = self.position(base), self.position(quote)
+        if i is None or j is None:
+            return None
+        return float(self.rates[i, j])
+
+
+class RateMatrixCache:
+    """
+    Keep the matrix of the latest snapshots, rebuilding it only when one of
+    them was republished, so requests between two scrapes share one matrix.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self):
+        self._key = None
+        self._matrix = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def instance(cls) -> "RateMatrixCache":
+        """Return the process-wide cache."""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    def get(
+        self,
+        key: Hashable,
+        snapshots: dict[tuple[str, str], list[dict[str, Any]]],
+    ) -> RateMatrix:
+        """Return the matrix for ``key`` (the snapshots' generations)."""
+        with self._lock:
+            if self._matrix is None or self._key != key:
+                self._matrix = RateMatrix.from_snapshots(snapshots)
+                self._key = key
+            return self._matrix
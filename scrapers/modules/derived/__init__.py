@@ -0,0 +1,18 @@
+from .rates import (
+    DERIVED_RATES,
+    DerivedRate,
+    InstrumentRef,
+    compute_derived_rates,
+    required_snapshots,
+)
+from .manager import DerivedRatesManager, publish_derived_rates
+
+__all__ = [
+    "DERIVED_RATES",
+    "DerivedRate",
+    "DerivedRatesManager",
+    "InstrumentRef",
+    "compute_derived_rates",
+    "publish_derived_rates",
+    "required_snapshots",
+]
@@ -0,0 +1,67 @@
+import threading
+from django.conf import settings
+from scrapers.modules.logger import LoggerFactory
+from scrapers.modules.history.recorder import INSTRUMENT_KEYS
+from scrapers.modules.history.listeners import run_listener
+from scrapers.modules.snapshots import publish_snapshot, read_snapshot
+from .rates import DERIVED_RATES, compute_derived_rates, required_snapshots
+
+SCRAPERS_OUTPUT_BASE_DIR = settings.BASE_DIR / "scrapers_output"
+SCRAPERS_OUTPUT_DIR = SCRAPERS_OUTPUT_BASE_DIR / "derived"
+
+logger = LoggerFactory.get_logger("DerivedRatesManager", "scrapers/derived/manager")
+
+
+class DerivedRatesManager:
+    """
+    Recompute the derived rates from the latest TGJU and ArzDigital snapshots
+    and publish them as the ``rates`` category of the ``derived`` source.
+
+    Only the rates listed in ``SCRAPER_DERIVED_RATES`` are computed (all of
+    them when it is empty). Rates go through ``publish_snapshot`` like scraped
+    categories, so nothing is written unless a rate moved.
+    """
+
+    # Snapshots of different categories may be published concurrently
+    _lock = threading.Lock()
+
+    def __init__(self):
+        enabled = settings.SCRAPER_DERIVED_RATES
+        self.rates = tuple(
+            rate for rate in DERIVED_RATES if not enabled or rate.symbol in enabled
+        )
+
+    @property
+    def inputs(self) -> set[tuple[str, str]]:
+        return required_snapshots(self.rates)
+
+    def run(self):
+        with self._lock:
+            snapshots = {}
+            for source, category in self.inputs:
+                snapshot = read_snapshot(
+                    SCRAPERS_OUTPUT_BASE_DIR / source / f"{category}.json"
+                )
+                snapshots[(source, category)] = snapshot.data if snapshot else []
+
+            data = compute_derived_rates(self.rates, snapshots, INSTRUMENT_KEYS)
+            return publish_snapshot(
+                SCRAPERS_OUTPUT_DIR,
+                "derived",
+                "rates",
+                data,
+                key="symbol",
+                sender=self.__class__,
+            )
+
+
+def publish_derived_rates(sender, source, category, **kwargs):
+    """``snapshot_published`` receiver that refreshes the derived rates."""
+    if not settings.SCRAPER_DERIVED_RATES_ENABLED or source == "derived":
+        return
+
+    manager = DerivedRatesManager()
+    if (source, category) not in manager.inputs:
+        return
+
+    run_listener(logger, "publish derived rates", manager.run)
@@ -0,0 +1,154 @@
+import numpy as np
+from datetime import datetime, timezone
+from typing import Any, NamedTuple
+
+from scrapers.modules.normalize import numeric_value
+
+# Grams of pure gold in one Emami coin (8.133 g at 900 fineness)
+EMAMI_PURE_GOLD_GRAMS = 7.3197
+
+
+class InstrumentRef(NamedTuple):
+    """One instrument of a published snapshot and the field holding its price."""
+
+    source: str
+    category: str
+    key: str
+    field: str
+
+    @property
+    def snapshot(self) -> tuple[str, str]:
+        return self.source, self.category
+
+
+class DerivedRate(NamedTuple):
+    """
+    A figure computed from two published instruments.
+
+    A ``ratio`` is ``numerator / denominator * scale`` (``denominator`` may be
+    None for a plain multiple). A ``premium`` is how far, in percent, the
+    numerator trades above ``scale`` units of the denominator.
+    """
+
+    symbol: str
+    name: str
+    name_fa: str
+    kind: str
+    numerator: InstrumentRef
+    denominator: InstrumentRef | None
+    scale: float = 1.0
+    unit: str = ""
+
+
+USD = InstrumentRef("tgju", "currency", "دلار", "price")
+EUR = InstrumentRef("tgju", "currency", "یورو", "price")
+GOLD_24K = InstrumentRef("tgju", "gold", "طلای ۲۴ عیار", "price")
+EMAMI_COIN = InstrumentRef("tgju", "coin", "سکه امامی", "price")
+USDT = InstrumentRef("arzdigital", "crypto", "USDT", "price_irr")
+
+DERIVED_RATES = (
+    DerivedRate(
+        "USDT_PREMIUM",
+        "Tether premium over the dollar",
+        "حباب تتر",
+        "premium",
+        USDT,
+        USD,
+        unit="%",
+    ),
+    DerivedRate(
+        "EMAMI_VALUE",
+        "Emami coin gold value",
+        "ارزش ذاتی سکه امامی",
+        "ratio",
+        GOLD_24K,
+        None,
+        scale=EMAMI_PURE_GOLD_GRAMS,
+        unit="IRR",
+    ),
+    DerivedRate(
+        "EMAMI_BUBBLE",
+        "Emami coin bubble",
+        "حباب سکه امامی",
+        "premium",
+        EMAMI_COIN,
+        GOLD_24K,
+        scale=EMAMI_PURE_GOLD_GRAMS,
+        unit="%",
+    ),
+    DerivedRate(
+        "EUR_USD",
+        "Euro to dollar cross rate",
+        "نرخ یورو به دلار",
+        "ratio",
+        EUR,
+        USD,
+    ),
+)
+
+
+def required_snapshots(rates: tuple[DerivedRate, ...]) -> set[tuple[str, str]]:
+    """``(source, category)`` of every snapshot the rates read."""
+    refs = [rate.numerator for rate in rates]
+    refs += [rate.denominator for rate in rates if rate.denominator is not None]
+    return {ref.snapshot for ref in refs}
+
+
+def compute_derived_rates(
+    rates: tuple[DerivedRate, ...],
+    snapshots: dict[tuple[str, str], list[dict[str, Any]]],
+    keys: dict[str, str],
+) -> list[dict[str, Any]]:
+    """
+    Compute every rate in one vectorized pass over the latest snapshots.
+
+    ``snapshots`` maps ``(source, category)`` to its rows and ``keys`` maps a
+    source to the field naming its instruments. Rates with a missing or zero
+    input are left out.
+    """
+    if not rates:
+        return []
+
+    indexes = {
+        snapshot: {row[keys[snapshot[0]]]: row for row in rows}
+        for snapshot, rows in snapshots.items()
+    }
+
+    def price(ref: InstrumentRef | None) -> float:
+        if ref is None:
+            return 1.0
+        row = indexes.get(ref.snapshot, {}).get(ref.key)
+        value = numeric_value(row, ref.field) if row is not None else None
+        return np.nan if value is None else float(value)
+
+    numerators = np.array([price(rate.numerator) for rate in rates])
+    denominators = np.array([price(rate.denominator) for rate in rates])
+    scales = np.array([rate.scale for rate in rates])
+    premiums = np.array([rate.kind == "premium" for rate in rates])
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratios = numerators / denominators
+        values = np.where(premiums, (ratios / scales - 1) * 100, ratios * scales)
+
+    last_update = datetime.now(timezone.utc).isoformat()
+    return [
+        {
+            "symbol": rate.symbol,
+            "name": rate.name,
+            "name_fa": rate.name_fa,
+            "value": format_value(value, rate.unit),
+            "unit": rate.unit,
+            "last_update": last_update,
+        }
+        for rate, value in zip(rates, values.tolist())
+        if np.isfinite(value)
+    ]
+
+
+def format_value(value: float, unit: str) -> str:
+    """Display a rate like the scraped figures: rials whole, percentages signed."""
+    if unit == "IRR":
+        return str(round(value))
+    if unit == "%":
+        return f"{value:.2f}%"
+    return f"{value:.4f}"
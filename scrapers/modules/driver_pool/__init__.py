@@ -0,0 +1,3 @@
+from .pool import ChromeDriverPool
+
+__all__ = ["ChromeDriverPool"]
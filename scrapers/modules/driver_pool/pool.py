@@ -0,0 +1,250 @@
+import time
+import atexit
+import platform
+import threading
+from selenium import webdriver
+from typing import Generator
+from django.conf import settings
+from contextlib import contextmanager
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from webdriver_manager.chrome import ChromeDriverManager
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+from scrapers.modules.logger import LoggerFactory
+
+
+class PooledDriver:
+    """A Chrome driver owned by the pool, with its usage bookkeeping."""
+
+    def __init__(self, driver: webdriver.Chrome):
+        self.driver = driver
+        self.pages = 0
+        self.broken = False
+        self.last_used = time.monotonic()
+
+
+class ChromeDriverPool:
+    """
+    Thread-safe pool of long-lived headless Chrome drivers.
+
+    Drivers are created lazily up to ``size``, health-checked before every
+    borrow, recycled after ``max_pages`` navigations and quit once they have
+    been idle for ``idle_timeout`` seconds.
+    """
+
+    _platform = platform.system()
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(
+        self,
+        size: int = 2,
+        max_pages: int = 50,
+        idle_timeout: int = 900,
+        acquire_timeout: int = 60,
+        auto_driver: bool = False,
+    ):
+        self.size = max(1, size)
+        self.max_pages = max_pages
+        self.idle_timeout = idle_timeout
+        self.acquire_timeout = acquire_timeout
+        self.auto_driver = auto_driver
+        self.logger = LoggerFactory.get_logger("ChromeDriverPool", "scrapers/pool")
+
+        self._idle: list[PooledDriver] = []
+        self._total = 0
+        self._closed = False
+        self._condition = threading.Condition()
+        self._reaper = None
+
+    @classmethod
+    def instance(cls) -> "ChromeDriverPool":
+        """Return the process-wide pool, creating it from settings on first use."""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls(
+                        size=settings.SCRAPER_DRIVER_POOL_SIZE,
+                        max_pages=settings.SCRAPER_DRIVER_MAX_PAGES,
+                        idle_timeout=settings.SCRAPER_DRIVER_IDLE_TIMEOUT,
+                        acquire_timeout=settings.SCRAPER_DRIVER_ACQUIRE_TIMEOUT,
+                        auto_driver=settings.SCRAPER_AUTO_DRIVER,
+                    )
+                    atexit.register(cls._instance.close)
+        return cls._instance
+
+    @contextmanager
+    def driver(self) -> Generator[webdriver.Chrome, None, None]:
+        """Borrow a driver for a single page load and return it afterwards."""
+        pooled = self.acquire()
+        try:
+            yield pooled.driver
+        except TimeoutException:
+            raise
+        except WebDriverException:
+            pooled.broken = True
+            raise
+        finally:
+            self.release(pooled)
+
+    def acquire(self) -> PooledDriver:
+        """Take a healthy driver from the pool, starting a new one if allowed."""
+        deadline = time.monotonic() + self.acquire_timeout
+
+        while True:
+            pooled = None
+            create = False
+            with self._condition:
+                if self._closed:
+                    raise RuntimeError("Chrome driver pool is closed.")
+
+                expired = self._take_expired_locked()
+
+                if self._idle:
+                    pooled = self._idle.pop()  # LIFO keeps the warmest driver busy
+                elif self._total < self.size:
+                    self._total += 1
+                    create = True
+                elif not expired:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise TimeoutError("No Chrome driver became available in time.")
+                    self._condition.wait(remaining)
+                    continue
+
+            # Evicted drivers free their slots, so retry after quitting them
+            self._discard_all(expired)
+
+            if create:
+                return self._start_driver()
+
+            if pooled is None:
+                continue
+
+            if self._is_healthy(pooled):
+                return pooled
+
+            self.logger.warning("Discarding unhealthy Chrome driver.")
+            self._discard(pooled)
+
+    def release(self, pooled: PooledDriver):
+        """Return a borrowed driver, recycling it if it is worn out or broken."""
+        pooled.pages += 1
+        pooled.last_used = time.monotonic()
+
+        if pooled.broken or pooled.pages >= self.max_pages or self._closed:
+            if pooled.pages >= self.max_pages:
+                self.logger.info(f"Recycling Chrome driver after {pooled.pages} pages.")
+            self._discard(pooled)
+            return
+
+        with self._condition:
+            self._idle.append(pooled)
+            self._condition.notify()
+
+    def evict_idle(self):
+        """Quit every driver that has been idle longer than ``idle_timeout``."""
+        with self._condition:
+            expired = self._take_expired_locked()
+        self._discard_all(expired)
+
+    def close(self):
+        """Quit all idle drivers and refuse further borrows."""
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._condition.notify_all()
+
+        self._discard_all(idle)
+
+    @property
+    def stats(self) -> dict[str, int]:
+        with self._condition:
+            return {"size": self.size, "total": self._total, "idle": len(self._idle)}
+
+    def _start_driver(self) -> PooledDriver:
+        try:
+            driver = self._create_driver()
+        except Exception:
+            with self._condition:
+                self._total -= 1
+                self._condition.notify()
+            raise
+
+        self._ensure_reaper()
+        self.logger.info("Started a new Chrome driver.")
+        return PooledDriver(driver)
+
+    def _create_driver(self) -> webdriver.Chrome:
+        """Launch a new headless Chrome driver instance."""
+        # Initialize the driver path based on the platform
+        linux_path = (
+            settings.BASE_DIR / "scrapers/drivers/chrome_driver_linux/chromedriver"
+        )
+        windows_path = (
+            settings.BASE_DIR
+            / "scrapers/drivers/chrome_driver_windows/chromedriver.exe"
+        )
+
+        driver_path = windows_path if self._platform == "Windows" else linux_path
+
+        # Initialize the service based on the auto_driver flag
+        service = (
+            Service(driver_path)
+            if not self.auto_driver
+            else Service(ChromeDriverManager().install())
+        )
+
+        options = Options()
+        options.add_argument("--headless")
+        options.add_argument("--disable-gpu")
+        options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64)")
+        return webdriver.Chrome(service=service, options=options)
+
+    def _is_healthy(self, pooled: PooledDriver) -> bool:
+        try:
+            pooled.driver.execute_script("return document.readyState")
+            return True
+        except WebDriverException:
+            return False
+
+    def _discard(self, pooled: PooledDriver):
+        try:
+            pooled.driver.quit()
+        except Exception as e:
+            self.logger.warning(f"Failed to quit Chrome driver: {str(e)}")
+        finally:
+            with self._condition:
+                self._total -= 1
+                self._condition.notify()
+
+    def _discard_all(self, drivers: list[PooledDriver]):
+        for pooled in drivers:
+            self._discard(pooled)
+
+    def _take_expired_locked(self) -> list[PooledDriver]:
+        """Detach idle drivers past their timeout; the caller quits them unlocked."""
+        now = time.monotonic()
+        expired = [p for p in self._idle if now - p.last_used > self.idle_timeout]
+        if expired:
+            self._idle = [p for p in self._idle if p not in expired]
+            self.logger.info(f"Evicting {len(expired)} idle Chrome driver(s).")
+        return expired
+
+    def _ensure_reaper(self):
+        """Start the background thread that evicts idle drivers."""
+        with self._condition:
+            if self._reaper is not None:
+                return
+            self._reaper = threading.Thread(
+                target=self._reap, name="chrome-driver-reaper", daemon=True
+            )
+            self._reaper.start()
+
+    def _reap(self):
+        interval = max(1, self.idle_timeout // 2)
+        while not self._closed:
+            time.sleep(interval)
+            self.evict_idle()
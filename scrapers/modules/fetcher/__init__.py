@@ -0,0 +1,3 @@
+from .http_fetcher import HttpFetcher
+
+__all__ = ["HttpFetcher"]
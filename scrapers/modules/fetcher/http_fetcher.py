@@ -0,0 +1,73 @@
+import threading
+import requests
+from django.conf import settings
+from urllib3.util.retry import Retry
+from requests.adapters import HTTPAdapter
+
+from scrapers.modules.logger import LoggerFactory
+
+
+class HttpFetcher:
+    """
+    Lightweight page fetcher backed by a pooled, keep-alive ``requests`` session.
+
+    Used to read server-rendered tables without starting a browser.
+    """
+
+    DEFAULT_HEADERS = {
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)",
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+        "Accept-Encoding": "gzip, deflate",
+        "Accept-Language": "fa-IR,fa;q=0.9,en-US;q=0.8,en;q=0.7",
+        "Connection": "keep-alive",
+    }
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, pool_size: int = 10, timeout: int = 10, retries: int = 2):
+        self.timeout = timeout
+        self.logger = LoggerFactory.get_logger("HttpFetcher", "scrapers/fetcher")
+
+        adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=Retry(
+                total=retries,
+                backoff_factor=0.3,
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=("GET",),
+            ),
+        )
+
+        self.session = requests.Session()
+        self.session.headers.update(self.DEFAULT_HEADERS)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    @classmethod
+    def instance(cls) -> "HttpFetcher":
+        """Return the process-wide fetcher, creating it from settings on first use."""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls(
+                        pool_size=settings.SCRAPER_HTTP_POOL_SIZE,
+                        timeout=settings.SCRAPER_HTTP_TIMEOUT,
+                    )
+        return cls._instance
+
+    def get_text(self, url: str) -> str | None:
+        """Return the decoded body of ``url``, or None if the request failed."""
+        try:
+            response = self.session.get(url, timeout=self.timeout)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            self.logger.warning(f"HTTP fetch of {url} failed: {str(e)}")
+            return None
+
+        # Both sites serve UTF-8 but do not always declare it in the headers
+        response.encoding = response.encoding or "utf-8"
+        if response.encoding.lower() == "iso-8859-1":
+            response.encoding = "utf-8"
+        return response.text
@@ -0,0 +1,24 @@
+from .downsample import lttb
+from .candles import (
+    PRICE_FIELDS,
+    CandleAggregator,
+    bucket_start,
+    fill_candles,
+    update_candles,
+)
+from .columnar import ColumnarHistory, append_columnar_history, summarize
+from .recorder import PriceHistoryRecorder, record_price_history
+
+__all__ = [
+    "PRICE_FIELDS",
+    "CandleAggregator",
+    "ColumnarHistory",
+    "PriceHistoryRecorder",
+    "append_columnar_history",
+    "bucket_start",
+    "fill_candles",
+    "lttb",
+    "record_price_history",
+    "summarize",
+    "update_candles",
+]
@@ -0,0 +1,175 @@
+import threading
+from datetime import datetime, timedelta, timezone as dt_timezone
+from decimal import Decimal
+from django.conf import settings
+from django.utils import timezone
+
+from scrapers.models import PriceCandle
+from scrapers.modules.logger import LoggerFactory
+from scrapers.modules.normalize import numeric_value
+from .recorder import INSTRUMENT_KEYS
+from .listeners import published_at, run_listener
+
+# Field holding the price a candle tracks in each source's rows
+PRICE_FIELDS = {"tgju": "price", "arzdigital": "price_usd", "derived": "value"}
+
+logger = LoggerFactory.get_logger("CandleAggregator", "scrapers/history")
+
+
+def bucket_start(timestamp: datetime, resolution: str) -> datetime:
+    """Start of the ``resolution`` bucket containing ``timestamp``, in UTC."""
+    seconds = PriceCandle.RESOLUTION_SECONDS[resolution]
+    epoch = int(timestamp.timestamp())
+    return datetime.fromtimestamp(epoch - epoch % seconds, tz=dt_timezone.utc)
+
+
+def fill_candles(
+    candles: list[PriceCandle],
+    previous: PriceCandle | None,
+    first_open: datetime,
+    last_open: datetime,
+    resolution: str,
+) -> list[PriceCandle]:
+    """
+    One candle per bucket from ``first_open`` to ``last_open``.
+
+    Candles are only written for buckets in which the instrument was
+    published, so a bucket without one gets a flat, unsaved candle at the
+    previous close with ``samples`` 0. ``previous`` is the last candle before
+    ``first_open``; buckets before the first known close are left out.
+    """
+    step = timedelta(seconds=PriceCandle.RESOLUTION_SECONDS[resolution])
+    stored = {candle.open_time: candle for candle in candles}
+
+    filled = []
+    open_time = first_open
+    while open_time <= last_open:
+        candle = stored.get(open_time)
+        if candle is None and previous is not None:
+            candle = PriceCandle(
+                source=previous.source,
+                category=previous.category,
+                instrument=previous.instrument,
+                resolution=resolution,
+                open_time=open_time,
+                open=previous.close,
+                high=previous.close,
+                low=previous.close,
+                close=previous.close,
+                samples=0,
+            )
+        if candle is not None:
+            filled.append(candle)
+            previous = candle
+        open_time += step
+    return filled
+
+
+class CandleAggregator:
+    """
+    Fold each published scrape into the open candle of every resolution.
+
+    The open candles are kept in memory, so a scrape costs one upsert per
+    category instead of a scan of the price history. After a restart the
+    current buckets are loaded back from the database on first use; older
+    candles are never touched again.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self):
+        self._open: dict[tuple[str, str, str], PriceCandle] = {}
+        self._loaded: dict[tuple[str, str], datetime] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def instance(cls) -> "CandleAggregator":
+        """Return the process-wide aggregator."""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    def update(
+        self,
+        source: str,
+        category: str,
+        rows: list[dict],
+        timestamp: datetime | None = None,
+    ) -> int:
+        """Apply one scrape's prices and return how many candles were written."""
+        key, price_field = INSTRUMENT_KEYS[source], PRICE_FIELDS[source]
+        timestamp = timestamp or timezone.now()
+
+        prices = {}
+        for row in rows:
+            price = numeric_value(row, price_field)
+            if price is not None:
+                prices[row[key]] = Decimal(price)
+
+        candles = []
+        with self._lock:
+            for resolution in PriceCandle.RESOLUTION_SECONDS:
+                open_time = bucket_start(timestamp, resolution)
+                self._load_bucket(category, resolution, open_time)
+
+                for instrument, price in prices.items():
+                    candle = self._open.get((category, instrument, resolution))
+                    if candle is None or candle.open_time != open_time:
+                        candle = PriceCandle(
+                            source=source,
+                            category=category,
+                            instrument=instrument,
+                            resolution=resolution,
+                            open_time=open_time,
+                            open=price,
+                            high=price,
+                            low=price,
+                            close=price,
+                            samples=0,
+                        )
+                        self._open[(category, instrument, resolution)] = candle
+
+                    candle.high = max(candle.high, price)
+                    candle.low = min(candle.low, price)
+                    candle.close = price
+                    candle.samples += 1
+                    candles.append(candle)
+
+            PriceCandle.objects.bulk_create(
+                candles,
+                batch_size=500,
+                update_conflicts=True,
+                unique_fields=["category", "instrument", "resolution", "open_time"],
+                update_fields=["high", "low", "close", "samples"],
+            )
+        return len(candles)
+
+    def _load_bucket(self, category: str, resolution: str, open_time: datetime):
+        """Pick up candles of the current bucket written before a restart."""
+        if self._loaded.get((category, resolution)) == open_time:
+            return
+        self._loaded[(category, resolution)] = open_time
+
+        for candle in PriceCandle.objects.filter(
+            category=category, resolution=resolution, open_time=open_time
+        ):
+            self._open[(category, candle.instrument, resolution)] = candle
+
+
+def update_candles(sender, source, category, data, meta=None, **kwargs):
+    """``snapshot_published`` receiver that updates the open candles."""
+    if not settings.SCRAPER_CANDLES_ENABLED:
+        return
+
+    run_listener(
+        logger,
+        f"update {source} {category} candles",
+        CandleAggregator.instance().update,
+        source,
+        category,
+        data,
+        timestamp=published_at(meta),
+    )
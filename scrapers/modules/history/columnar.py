@@ -0,0 +1,237 @@
+import os
+import time
+import threading
+import numpy as np
+from pathlib import Path
+from urllib.parse import quote
+from datetime import datetime, timedelta, timezone as dt_timezone
+from django.conf import settings
+from django.utils import timezone
+
+from scrapers.modules.logger import LoggerFactory
+from scrapers.modules.normalize import numeric_value
+from .recorder import INSTRUMENT_KEYS
+from .candles import PRICE_FIELDS
+from .listeners import published_at, run_listener
+
+# Field holding the percentage change in each source's rows, if any
+CHANGE_FIELDS = {"tgju": "change_percentage", "arzdigital": "change_24h"}
+
+# One fixed-width record per point; timestamps are POSIX seconds
+RECORD_DTYPE = np.dtype([("timestamp", "<f8"), ("price", "<f8"), ("change", "<f8")])
+
+logger = LoggerFactory.get_logger("ColumnarHistory", "scrapers/history")
+
+
+def summarize(values: np.ndarray) -> dict | None:
+    """Open, high, low, close, mean and count of a series, None when empty."""
+    if not values.size:
+        return None
+    return {
+        "open": float(values[0]),
+        "high": float(values.max()),
+        "low": float(values.min()),
+        "close": float(values[-1]),
+        "mean": float(values.mean()),
+        "count": int(values.size),
+    }
+
+
+class ColumnarHistory:
+    """
+    Price history as fixed-width binary segments read through ``numpy.memmap``.
+
+    Each instrument has one segment file per month under
+    ``<root>/<category>/<instrument>/<YYYY-MM>.bin`` holding ``RECORD_DTYPE``
+    records in time order. Appends are plain writes to the end of the file and
+    reads map the segments of a range without copying them, so scans and
+    aggregations run on arrays instead of model instances. Segments entirely
+    older than the retention period are deleted at most once per
+    ``prune_interval`` seconds.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(
+        self, root: Path, retention_days: int = 30, prune_interval: int = 3600
+    ):
+        self.root = Path(root)
+        self.retention_days = retention_days
+        self.prune_interval = prune_interval
+        self._last_prune = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def instance(cls) -> "ColumnarHistory":
+        """Return the process-wide store, creating it from settings on first use."""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls(
+                        settings.SCRAPER_COLUMNAR_HISTORY_DIR,
+                        retention_days=settings.SCRAPER_HISTORY_RETENTION_DAYS,
+                    )
+        return cls._instance
+
+    def append(
+        self,
+        source: str,
+        category: str,
+        rows: list[dict],
+        timestamp: datetime | None = None,
+    ) -> int:
+        """Append one record per priced row and return how many were written."""
+        key = INSTRUMENT_KEYS[source]
+        price_field, change_field = PRICE_FIELDS[source], CHANGE_FIELDS.get(source)
+        timestamp = timestamp or timezone.now()
+
+        written = 0
+        with self._lock:
+            for row in rows:
+                price = numeric_value(row, price_field)
+                if price is None:
+                    continue
+                change = numeric_value(row, change_field)
+
+                record = np.array(
+                    [
+                        (
+                            timestamp.timestamp(),
+                            float(price),
+                            np.nan if change is None else change,
+                        )
+                    ],
+                    dtype=RECORD_DTYPE,
+                )
+                path = self._segment_path(category, row[key], timestamp)
+                os.makedirs(path.parent, exist_ok=True)
+                with open(path, "ab") as f:
+                    # Drop a record left half-written by a crash, so later
+                    # records stay aligned
+                    torn = f.tell() % RECORD_DTYPE.itemsize
+                    if torn:
+                        f.truncate(f.tell() - torn)
+                    f.write(record.tobytes())
+                written += 1
+
+        self.prune_if_due()
+        return written
+
+    def read(
+        self,
+        category: str,
+        instrument: str,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> np.ndarray:
+        """
+        Records of ``instrument`` with ``start <= timestamp < end``.
+
+        A range within one segment is returned as a view of the mapped file;
+        ranges spanning several segments are concatenated into one array.
+        """
+        low = start.timestamp() if start else -np.inf
+        high = end.timestamp() if end else np.inf
+
+        parts = []
+        for path in self._segments(category, instrument, start, end):
+            records = self._map(path)
+            timestamps = records["timestamp"]
+            first = np.searchsorted(timestamps, low, side="left")
+            last = np.searchsorted(timestamps, high, side="left")
+            if first < last:
+                parts.append(records[first:last])
+
+        if not parts:
+            return np.empty(0, dtype=RECORD_DTYPE)
+        return parts[0] if len(parts) == 1 else np.concatenate(parts)
+
+    def summary(
+        self,
+        category: str,
+        instrument: str,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> dict | None:
+        """Open, high, low, close, mean and count of the price over a range."""
+        return summarize(self.read(category, instrument, start, end)["price"])
+
+    def prune_if_due(self):
+        if not self.retention_days:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            if self._last_prune is not None and (
+                now - self._last_prune < self.prune_interval
+            ):
+                return
+            self._last_prune = now
+
+        self.prune()
+
+    def prune(self) -> int:
+        """Delete segments whose month ended before the retention period."""
+        cutoff = timezone.now() - timedelta(days=self.retention_days)
+        oldest_kept = self._segment_name(cutoff)
+
+        deleted = 0
+        for path in self.root.glob("*/*/*.bin"):
+            if path.name < oldest_kept:
+                path.unlink(missing_ok=True)
+                deleted += 1
+        if deleted:
+            logger.info(f"Pruned {deleted} history segments before {oldest_kept}.")
+        return deleted
+
+    def _segment_path(
+        self, category: str, instrument: str, timestamp: datetime
+    ) -> Path:
+        return (
+            self.root
+            / category
+            / quote(instrument, safe="")
+            / self._segment_name(timestamp)
+        )
+
+    def _segment_name(self, timestamp: datetime) -> str:
+        return f"{timestamp.astimezone(dt_timezone.utc):%Y-%m}.bin"
+
+    def _segments(
+        self,
+        category: str,
+        instrument: str,
+        start: datetime | None,
+        end: datetime | None,
+    ) -> list[Path]:
+        """Segment files of ``instrument`` that may overlap the range, in order."""
+        directory = self.root / category / quote(instrument, safe="")
+        first = self._segment_name(start) if start else ""
+        last = self._segment_name(end) if end else "~"
+        return sorted(
+            path for path in directory.glob("*.bin") if first <= path.name <= last
+        )
+
+    def _map(self, path: Path) -> np.ndarray:
+        """Map a segment read-only, ignoring a partially written last record."""
+        count = path.stat().st_size // RECORD_DTYPE.itemsize
+        if not count:
+            return np.empty(0, dtype=RECORD_DTYPE)
+        return np.memmap(path, dtype=RECORD_DTYPE, mode="r", shape=(count,))
+
+
+def append_columnar_history(sender, source, category, delta, meta=None, **kwargs):
+    """``snapshot_published`` receiver that appends the moved instruments."""
+    if not settings.SCRAPER_COLUMNAR_HISTORY_ENABLED or not delta.moved:
+        return
+
+    run_listener(
+        logger,
+        f"append {source} {category} columnar history",
+        ColumnarHistory.instance().append,
+        source,
+        category,
+        delta.moved,
+        timestamp=published_at(meta),
+    )
@@ -0,0 +1,44 @@
+def lttb(
+    points: list[tuple[float, float]], threshold: int
+) -> list[tuple[float, float]]:
+    """
+    Downsample ``(x, y)`` points sorted by x to ``threshold`` points with
+    Largest-Triangle-Three-Buckets, which keeps the visual shape of a series
+    (peaks and troughs) better than averaging. The first and last points are
+    always kept.
+    """
+    count = len(points)
+    if threshold >= count or threshold < 3:
+        return list(points)
+
+    sampled = [points[0]]
+    bucket_size = (count - 2) / (threshold - 2)
+    selected = 0
+
+    for bucket in range(threshold - 2):
+        # Average of the next bucket, the third corner of the triangles
+        next_start = int((bucket + 1) * bucket_size) + 1
+        next_end = min(int((bucket + 2) * bucket_size) + 1, count)
+        next_points = points[next_start:next_end]
+        avg_x = sum(x for x, _ in next_points) / len(next_points)
+        avg_y = sum(y for _, y in next_points) / len(next_points)
+
+        # Keep the point of this bucket forming the largest triangle
+        start = int(bucket * bucket_size) + 1
+        end = int((bucket + 1) * bucket_size) + 1
+        selected_x, selected_y = points[selected]
+        largest_area, largest = -1.0, start
+        for index in range(start, end):
+            x, y = points[index]
+            area = abs(
+                (selected_x - avg_x) * (y - selected_y)
+                - (selected_x - x) * (avg_y - selected_y)
+            )
+            if area > largest_area:
+                largest_area, largest = area, index
+
+        sampled.append(points[largest])
+        selected = largest
+
+    sampled.append(points[-1])
+    return sampled
@@ -0,0 +1,19 @@
+from datetime import datetime
+from typing import Any, Callable
+
+
+def published_at(meta: dict[str, Any] | None) -> datetime | None:
+    """Scrape time from a ``snapshot_published`` meta header, if it has one."""
+    scraped_at = (meta or {}).get("scraped_at")
+    return datetime.fromisoformat(scraped_at) if scraped_at else None
+
+
+def run_listener(logger, action: str, func: Callable, *args, **kwargs):
+    """
+    Run a ``snapshot_published`` listener's work, logging instead of raising:
+    a listener must never stop a snapshot from being published.
+    """
+    try:
+        return func(*args, **kwargs)
+    except Exception as e:
+        logger.error(f"Failed to {action}: {str(e)}")
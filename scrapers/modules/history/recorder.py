@@ -0,0 +1,119 @@
+import time
+import threading
+from datetime import datetime, timedelta
+from django.conf import settings
+from django.utils import timezone
+
+from scrapers.models import PricePoint
+from scrapers.modules.logger import LoggerFactory
+from .listeners import published_at, run_listener
+
+# Field identifying an instrument within each source's rows
+INSTRUMENT_KEYS = {"tgju": "title", "arzdigital": "symbol", "derived": "symbol"}
+
+# Fields describing the scrape rather than the instrument
+SKIPPED_FIELDS = ("last_update",)
+
+logger = LoggerFactory.get_logger("PriceHistoryRecorder", "scrapers/history")
+
+
+class PriceHistoryRecorder:
+    """
+    Append published instruments to the ``PricePoint`` history.
+
+    Only instruments that were added or changed by a scrape are stored, so the
+    history is a step series: an instrument kept its last recorded values
+    until its next point. Points older than the retention period are pruned
+    at most once per ``prune_interval`` seconds.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, retention_days: int = 30, prune_interval: int = 3600):
+        self.retention_days = retention_days
+        self.prune_interval = prune_interval
+        self._last_prune = None
+        self._prune_lock = threading.Lock()
+
+    @classmethod
+    def instance(cls) -> "PriceHistoryRecorder":
+        """Return the process-wide recorder, creating it from settings on first use."""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls(
+                        retention_days=settings.SCRAPER_HISTORY_RETENTION_DAYS
+                    )
+        return cls._instance
+
+    def record(
+        self,
+        source: str,
+        category: str,
+        rows: list[dict],
+        generation: int = 0,
+        timestamp: datetime | None = None,
+    ) -> int:
+        """Bulk insert one point per row and return how many were stored."""
+        key = INSTRUMENT_KEYS[source]
+        timestamp = timestamp or timezone.now()
+
+        points = [
+            PricePoint(
+                source=source,
+                category=category,
+                instrument=row[key],
+                generation=generation,
+                timestamp=timestamp,
+                values={
+                    field: value
+                    for field, value in row.items()
+                    if field != key and field not in SKIPPED_FIELDS
+                },
+            )
+            for row in rows
+        ]
+        PricePoint.objects.bulk_create(points, batch_size=500)
+
+        self.prune_if_due()
+        return len(points)
+
+    def prune_if_due(self):
+        if not self.retention_days:
+            return
+
+        with self._prune_lock:
+            now = time.monotonic()
+            if self._last_prune is not None and (
+                now - self._last_prune < self.prune_interval
+            ):
+                return
+            self._last_prune = now
+
+        self.prune()
+
+    def prune(self) -> int:
+        """Delete points older than the retention period."""
+        cutoff = timezone.now() - timedelta(days=self.retention_days)
+        deleted, _ = PricePoint.objects.filter(timestamp__lt=cutoff).delete()
+        if deleted:
+            logger.info(f"Pruned {deleted} price points older than {cutoff}.")
+        return deleted
+
+
+def record_price_history(sender, source, category, delta, meta=None, **kwargs):
+    """``snapshot_published`` receiver that stores the moved instruments."""
+    if not settings.SCRAPER_HISTORY_ENABLED or not delta.moved:
+        return
+
+    run_listener(
+        logger,
+        f"record {source} {category} history",
+        PriceHistoryRecorder.instance().record,
+        source,
+        category,
+        delta.moved,
+        generation=(meta or {}).get("generation", 0),
+        timestamp=published_at(meta),
+    )
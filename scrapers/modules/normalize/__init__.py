@@ -0,0 +1,19 @@
+from .numbers import (
+    FIELD_KINDS,
+    NUMERIC_FIELD,
+    PERSIAN_DIGITS_TABLE,
+    normalize_row,
+    normalize_rows,
+    numeric_value,
+    parse_number,
+)
+
+__all__ = [
+    "FIELD_KINDS",
+    "NUMERIC_FIELD",
+    "PERSIAN_DIGITS_TABLE",
+    "normalize_row",
+    "normalize_rows",
+    "numeric_value",
+    "parse_number",
+]
@@ -0,0 +1,116 @@
+import re
+from decimal import Decimal, InvalidOperation
+from typing import Any
+
+# Key of the typed values stored in every published row
+NUMERIC_FIELD = "numeric"
+
+# Persian and Arabic-Indic digits, and their thousands and decimal separators
+PERSIAN_DIGITS_TABLE = str.maketrans(
+    "۰۱۲۳۴۵۶۷۸۹٠١٢٣٤٥٦٧٨٩٫−", "01234567890123456789.-", "٬,$%()"
+)
+
+# Unit of each numeric display field
+FIELD_KINDS = {
+    "price": "rial",
+    "change_amount": "rial",
+    "change_percentage": "percent",
+    "price_usd": "usd",
+    "price_irr": "rial",
+    "market_cap": "usd",
+    "change_24h": "percent",
+    "value": "number",
+}
+
+# Magnitude suffixes of abbreviated amounts such as ``"$1.2T"``
+SUFFIX_MULTIPLIERS = {
+    "K": Decimal(10) ** 3,
+    "M": Decimal(10) ** 6,
+    "B": Decimal(10) ** 9,
+    "T": Decimal(10) ** 12,
+}
+
+NUMBER_PATTERN = re.compile(r"^([+-]?\d+(?:\.\d+)?)\s*([KMBT])?$", re.IGNORECASE)
+
+
+def parse_number(value: Any) -> Decimal | None:
+    """
+    Read a display string such as ``"820,000"``, ``"$65,000.12"``, ``"-2.5%"``,
+    ``"$1.2T"`` or ``"۸۲۰٬۰۰۰"`` as an exact number; None if it is not one.
+    """
+    if value is None:
+        return None
+    if isinstance(value, (int, float, Decimal)):
+        return Decimal(str(value))
+
+    text = str(value).translate(PERSIAN_DIGITS_TABLE).replace("ت", "").strip()
+    match = NUMBER_PATTERN.match(text)
+    if match is None:
+        return None
+
+    number, suffix = match.groups()
+    try:
+        amount = Decimal(number)
+    except InvalidOperation:
+        return None
+    return amount * SUFFIX_MULTIPLIERS[suffix.upper()] if suffix else amount
+
+
+def to_kind(number: Decimal | float | int | None, kind: str):
+    """Convert a number to the Python type of its unit."""
+    if number is None:
+        return None
+    if kind == "rial":
+        return int(number)
+    if kind == "usd":
+        return Decimal(str(number))
+    return float(number)
+
+
+def decimal_string(number: Decimal) -> str:
+    """Canonical text of a Decimal: plain notation without trailing zeros."""
+    return format(number.normalize(), "f")
+
+
+def normalize_row(row: dict[str, Any]) -> dict[str, Any]:
+    """
+    Store the typed values of a row's numeric display fields under
+    ``NUMERIC_FIELD``; the display strings are left as scraped.
+
+    Rials and percentages are kept as JSON integers and floats. USD amounts
+    are written as canonical decimal strings, since a JSON number would be
+    read back as a binary float, and are read back as ``Decimal`` by
+    ``numeric_value``.
+    """
+    numeric = {}
+    for field, kind in FIELD_KINDS.items():
+        if field not in row:
+            continue
+        value = to_kind(parse_number(row[field]), kind)
+        numeric[field] = decimal_string(value) if isinstance(value, Decimal) else value
+
+    row[NUMERIC_FIELD] = numeric
+    return row
+
+
+def normalize_rows(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Normalize every row of a scrape in place and return them."""
+    for row in rows:
+        normalize_row(row)
+    return rows
+
+
+def numeric_value(row: dict[str, Any], field: str) -> int | float | Decimal | None:
+    """
+    Typed value of a numeric field: an ``int`` of rials, a ``Decimal`` of USD,
+    or a ``float`` percentage or derived rate. Rows published before
+    normalization existed are parsed from their display string.
+    """
+    kind = FIELD_KINDS.get(field)
+    if kind is None:
+        return None
+
+    numeric = row.get(NUMERIC_FIELD)
+    if numeric is not None and field in numeric:
+        return to_kind(numeric[field], kind)
+    return to_kind(parse_number(row.get(field)), kind)
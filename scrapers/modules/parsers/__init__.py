@@ -0,0 +1,8 @@
+from .row_parsers import (
+    RowParser,
+    FullTreeRowParser,
+    StrainedRowParser,
+    get_row_parser,
+)
+
+__all__ = ["RowParser", "FullTreeRowParser", "StrainedRowParser", "get_row_parser"]
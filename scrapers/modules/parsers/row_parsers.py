@@ -0,0 +1,97 @@
+import importlib.util
+from abc import ABC, abstractmethod
+from bs4 import BeautifulSoup, SoupStrainer, Tag
+from bs4.builder import HTMLTreeBuilder
+
+from scrapers.modules.logger import LoggerFactory
+
+logger = LoggerFactory.get_logger("RowParser", "scrapers/parsers")
+
+# Attributes holding space-separated values on every tag, such as ``class``
+MULTI_VALUED_ATTRIBUTES = HTMLTreeBuilder.DEFAULT_CDATA_LIST_ATTRIBUTES["*"]
+
+
+class RowParser(ABC):
+    """Extracts the table rows a scraper cares about from a page."""
+
+    name = "base"
+
+    @abstractmethod
+    def extract_rows(self, content: str, attrs: dict) -> list[Tag]:
+        """Return every ``<tr>`` matching ``attrs`` as BeautifulSoup tags."""
+        pass
+
+
+class FullTreeRowParser(RowParser):
+    """Builds the whole document tree with ``html.parser`` (original behaviour)."""
+
+    name = "html.parser"
+
+    def extract_rows(self, content: str, attrs: dict) -> list[Tag]:
+        soup = BeautifulSoup(content, "html.parser")
+        return soup.find_all("tr", attrs)
+
+
+class StrainedRowParser(RowParser):
+    """
+    Only builds tags for the matching rows, skipping the rest of the page.
+
+    Rows are still BeautifulSoup tags, so row processing and its output are
+    unchanged; only the tree construction work is reduced.
+    """
+
+    def __init__(self, features: str = "html.parser"):
+        self.features = features
+        self.name = "strainer" if features == "html.parser" else features
+
+    def extract_rows(self, content: str, attrs: dict) -> list[Tag]:
+        strainer = SoupStrainer("tr", attrs=self._strainer_attrs(attrs))
+        soup = BeautifulSoup(content, self.features, parse_only=strainer)
+        return soup.find_all("tr", attrs)
+
+    def _strainer_attrs(self, attrs: dict) -> dict:
+        """
+        ``SoupStrainer`` compares the raw attribute string, so ``class`` values
+        are matched by membership instead, the way ``find_all`` matches them.
+        """
+        return {
+            name: (
+                _has_value(value)
+                if name in MULTI_VALUED_ATTRIBUTES and isinstance(value, str)
+                else value
+            )
+            for name, value in attrs.items()
+        }
+
+
+def _has_value(expected: str):
+    def match(value: str | None) -> bool:
+        return value is not None and (value == expected or expected in value.split())
+
+    return match
+
+
+_BACKENDS = {
+    "html.parser": FullTreeRowParser(),
+    "strainer": StrainedRowParser("html.parser"),
+    "lxml": StrainedRowParser("lxml"),
+}
+
+
+def get_row_parser(name: str) -> RowParser:
+    """
+    Return the row parser registered under ``name``.
+
+    ``lxml`` is an optional dependency; when it is missing the strained
+    ``html.parser`` backend is used instead.
+    """
+    if name not in _BACKENDS:
+        raise ValueError(
+            f"Unknown parser backend '{name}'. Choose from: {', '.join(_BACKENDS)}."
+        )
+
+    if name == "lxml" and importlib.util.find_spec("lxml") is None:
+        logger.warning("lxml is not installed, falling back to the strainer backend.")
+        return _BACKENDS["strainer"]
+
+    return _BACKENDS[name]
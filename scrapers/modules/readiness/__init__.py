@@ -0,0 +1,10 @@
+from .strategies import RowCountStrategy, MutationQuiescenceStrategy
+from .waiter import PageReadinessWaiter, ReadinessResult, SettleTimeTracker
+
+__all__ = [
+    "RowCountStrategy",
+    "MutationQuiescenceStrategy",
+    "PageReadinessWaiter",
+    "ReadinessResult",
+    "SettleTimeTracker",
+]
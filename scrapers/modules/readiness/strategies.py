@@ -0,0 +1,56 @@
+from typing import Hashable
+from abc import ABC, abstractmethod
+from selenium.webdriver.remote.webdriver import WebDriver
+
+
+class ReadinessStrategy(ABC):
+    """A signal sampled while waiting for a page to stop changing."""
+
+    name = "base"
+
+    def prepare(self, driver: WebDriver):
+        """Install whatever the strategy needs in the page before sampling."""
+        pass
+
+    @abstractmethod
+    def sample(self, driver: WebDriver) -> Hashable:
+        """Return a value that changes whenever the page is still settling."""
+        pass
+
+
+class RowCountStrategy(ReadinessStrategy):
+    """Settled once the number of rows matching ``selector`` stops growing."""
+
+    name = "row-count"
+
+    def __init__(self, selector: str):
+        self.selector = selector
+
+    def sample(self, driver: WebDriver) -> int:
+        return driver.execute_script(
+            "return document.querySelectorAll(arguments[0]).length;", self.selector
+        )
+
+
+class MutationQuiescenceStrategy(ReadinessStrategy):
+    """Settled once a MutationObserver on the document stops recording changes."""
+
+    name = "dom-quiescence"
+
+    _INSTALL_SCRIPT = """
+        if (!window.__arzWatchObserver) {
+            window.__arzWatchMutations = 0;
+            window.__arzWatchObserver = new MutationObserver(function (records) {
+                window.__arzWatchMutations += records.length;
+            });
+            window.__arzWatchObserver.observe(document.documentElement, {
+                childList: true, subtree: true, characterData: true
+            });
+        }
+    """
+
+    def prepare(self, driver: WebDriver):
+        driver.execute_script(self._INSTALL_SCRIPT)
+
+    def sample(self, driver: WebDriver) -> int:
+        return driver.execute_script("return window.__arzWatchMutations || 0;")
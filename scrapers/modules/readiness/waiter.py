@@ -0,0 +1,112 @@
+import time
+import threading
+from typing import NamedTuple
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from .strategies import ReadinessStrategy
+
+
+class ReadinessResult(NamedTuple):
+    """Outcome of a single readiness wait."""
+
+    elapsed: float  # Seconds spent waiting after the first row appeared
+    settled: bool  # False when the wait hit its upper bound instead
+    quiet_period: float  # Quiet period that was required for this wait
+    strategies: tuple[str, ...]
+
+
+class SettleTimeTracker:
+    """
+    Learns, per site, the longest pause between two page updates.
+
+    The quiet period a waiter requires is derived from this so that slow
+    sites are not cut off early and fast sites are not waited on for nothing.
+    """
+
+    def __init__(self, smoothing: float = 0.3, margin: float = 1.5):
+        self.smoothing = smoothing
+        self.margin = margin
+        self._gaps: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def quiet_period(self, site: str, minimum: float, maximum: float) -> float:
+        with self._lock:
+            gap = self._gaps.get(site)
+        if gap is None:
+            return maximum / 2
+        return min(maximum, max(minimum, gap * self.margin))
+
+    def record(self, site: str, largest_gap: float):
+        with self._lock:
+            previous = self._gaps.get(site)
+            self._gaps[site] = (
+                largest_gap
+                if previous is None
+                else previous + self.smoothing * (largest_gap - previous)
+            )
+
+
+class PageReadinessWaiter:
+    """
+    Waits until every strategy's signal has been stable for a quiet period.
+
+    Replaces a fixed sleep: the wait ends as soon as the page stops changing,
+    and never lasts longer than ``max_wait`` seconds.
+    """
+
+    tracker = SettleTimeTracker()
+
+    def __init__(
+        self,
+        site: str,
+        strategies: list[ReadinessStrategy],
+        max_wait: float = 5.0,
+        min_quiet: float = 0.3,
+        poll_interval: float = 0.1,
+    ):
+        self.site = site
+        self.strategies = strategies
+        self.max_wait = max_wait
+        self.min_quiet = min_quiet
+        self.poll_interval = poll_interval
+
+    def wait(self, driver: WebDriver) -> ReadinessResult:
+        for strategy in self.strategies:
+            strategy.prepare(driver)
+
+        quiet_period = self.tracker.quiet_period(
+            self.site, self.min_quiet, self.max_wait
+        )
+        start = last_change = time.monotonic()
+        largest_gap = 0.0
+        previous = self._sample(driver)
+        settled = False
+
+        while True:
+            time.sleep(self.poll_interval)
+            now = time.monotonic()
+
+            current = self._sample(driver)
+            if current != previous:
+                largest_gap = max(largest_gap, now - last_change)
+                last_change = now
+                previous = current
+
+            if now - last_change >= quiet_period:
+                settled = True
+                break
+            if now - start >= self.max_wait:
+                break
+
+        if settled:
+            self.tracker.record(self.site, largest_gap)
+
+        return ReadinessResult(
+            elapsed=time.monotonic() - start,
+            settled=settled,
+            quiet_period=quiet_period,
+            strategies=tuple(strategy.name for strategy in self.strategies),
+        )
+
+    def _sample(self, driver: WebDriver) -> tuple:
+        return tuple(strategy.sample(driver) for strategy in self.strategies)
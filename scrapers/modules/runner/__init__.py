@@ -0,0 +1,3 @@
+from .runner import RunReport, ScraperRunner
+
+__all__ = ["RunReport", "ScraperRunner"]
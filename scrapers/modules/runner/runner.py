@@ -0,0 +1,80 @@
+import time
+from django.db import connection
+from django.conf import settings
+from typing import Any, Callable, NamedTuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from scrapers.modules.logger import LoggerFactory
+
+
+class RunReport(NamedTuple):
+    """Per-task results and errors of a runner invocation."""
+
+    results: dict[str, Any]
+    errors: dict[str, Exception]
+    elapsed: float
+
+
+class ScraperRunner:
+    """
+    Runs named scrape tasks either one after another or on a bounded thread pool.
+
+    Threads are used rather than processes: scrapes spend their time waiting on
+    the network or on Chrome, and threads share the HTTP session and the
+    Chrome driver pool.
+    """
+
+    def __init__(self, max_workers: int | None = None):
+        self.max_workers = max_workers or settings.SCRAPER_MAX_WORKERS
+        self.logger = LoggerFactory.get_logger("ScraperRunner", "scrapers/runner")
+
+    def run(
+        self, tasks: dict[str, Callable[[], Any]], parallel: bool = True
+    ) -> RunReport:
+        start = time.monotonic()
+        results, errors = {}, {}
+
+        parallel = parallel and len(tasks) > 1 and self.max_workers > 1
+
+        if not parallel:
+            for name, task in tasks.items():
+                try:
+                    results[name] = task()
+                except Exception as e:
+                    self._record_error(errors, name, e)
+        else:
+            workers = min(self.max_workers, len(tasks))
+            with ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="scraper"
+            ) as executor:
+                futures = {
+                    executor.submit(self._run_in_thread, task): name
+                    for name, task in tasks.items()
+                }
+                for future in as_completed(futures):
+                    name = futures[future]
+                    try:
+                        results[name] = future.result()
+                    except Exception as e:
+                        self._record_error(errors, name, e)
+
+            # Keep the caller's ordering rather than completion order
+            results = {name: results[name] for name in tasks if name in results}
+
+        elapsed = time.monotonic() - start
+        self.logger.info(
+            f"Ran {len(tasks)} task(s) {'in parallel' if parallel else 'sequentially'} "
+            f"in {elapsed:.2f}s with {len(errors)} error(s)."
+        )
+        return RunReport(results=results, errors=errors, elapsed=elapsed)
+
+    def _run_in_thread(self, task: Callable[[], Any]) -> Any:
+        try:
+            return task()
+        finally:
+            # Worker threads get their own DB connection; don't leak it
+            connection.close()
+
+    def _record_error(self, errors: dict[str, Exception], name: str, error: Exception):
+        errors[name] = error
+        self.logger.error(f"Task {name} failed: {str(error)}")
@@ -0,0 +1,22 @@
+from .delta import SnapshotDelta, compute_delta
+from .changes import append_change, merge_changes, read_changes
+from .feed import SnapshotFeed
+from .cache import CachedSnapshot, SnapshotCache
+from .store import Snapshot, read_snapshot, read_snapshot_meta, write_snapshot
+from .publish import publish_snapshot
+
+__all__ = [
+    "CachedSnapshot",
+    "Snapshot",
+    "SnapshotCache",
+    "SnapshotDelta",
+    "SnapshotFeed",
+    "append_change",
+    "compute_delta",
+    "merge_changes",
+    "publish_snapshot",
+    "read_changes",
+    "read_snapshot",
+    "read_snapshot_meta",
+    "write_snapshot",
+]
@@ -0,0 +1,130 @@
+import os
+import time
+import threading
+from pathlib import Path
+from django.conf import settings
+from typing import Any, Callable
+
+from .store import Snapshot, read_snapshot, read_snapshot_meta
+
+
+class CachedSnapshot:
+    """A parsed snapshot plus anything derived from it for its generation."""
+
+    def __init__(self, snapshot: Snapshot, mtime_ns: int, size: int):
+        self.snapshot = snapshot
+        self.mtime_ns = mtime_ns
+        self.size = size
+        self.checked_at = time.monotonic()
+        self._artifacts: dict[str, Any] = {}
+        self._lock = threading.RLock()  # Builders may build other artifacts
+
+    @property
+    def data(self) -> list[dict[str, Any]]:
+        return self.snapshot.data
+
+    @property
+    def meta(self) -> dict[str, Any]:
+        return self.snapshot.meta
+
+    @property
+    def generation(self) -> int:
+        return self.snapshot.generation
+
+    def artifact(self, name: str, builder: Callable[["CachedSnapshot"], Any]) -> Any:
+        """Build ``name`` once for this generation and reuse it afterwards."""
+        if name not in self._artifacts:
+            with self._lock:
+                if name not in self._artifacts:
+                    self._artifacts[name] = builder(self)
+        return self._artifacts[name]
+
+
+class SnapshotCache:
+    """
+    Process-wide cache of parsed snapshot files.
+
+    Each file is parsed once; afterwards it is ``stat``-ed at most once per
+    ``stat_interval`` seconds and only re-read when its mtime or size changed
+    and its header reports a new generation.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, stat_interval: float = 1.0):
+        self.stat_interval = stat_interval
+        self._entries: dict[str, CachedSnapshot] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def instance(cls) -> "SnapshotCache":
+        """Return the process-wide cache, creating it from settings on first use."""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls(
+                        stat_interval=settings.SCRAPER_SNAPSHOT_STAT_INTERVAL
+                    )
+        return cls._instance
+
+    def get(self, path: Path | str) -> CachedSnapshot | None:
+        """Return the current snapshot at ``path``, or None if there is none."""
+        key = str(path)
+        entry = self._entries.get(key)
+        if (
+            entry is not None
+            and time.monotonic() - entry.checked_at < self.stat_interval
+        ):
+            return entry
+
+        with self._lock:
+            # Another thread may have revalidated while we waited for the lock
+            entry = self._entries.get(key)
+            if (
+                entry is not None
+                and time.monotonic() - entry.checked_at < self.stat_interval
+            ):
+                return entry
+
+            entry = self._revalidate(key, entry)
+            if entry is None:
+                self._entries.pop(key, None)
+            else:
+                self._entries[key] = entry
+            return entry
+
+    def invalidate(self, path: Path | str | None = None):
+        """Forget one cached file, or every file when ``path`` is None."""
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(str(path), None)
+
+    def _revalidate(
+        self, key: str, entry: CachedSnapshot | None
+    ) -> CachedSnapshot | None:
+        try:
+            stat = os.stat(key)
+        except FileNotFoundError:
+            return None
+
+        if entry is not None:
+            unchanged = (stat.st_mtime_ns, stat.st_size) == (entry.mtime_ns, entry.size)
+            if not unchanged:
+                meta = read_snapshot_meta(key) or {}
+                unchanged = (
+                    entry.generation > 0 and meta.get("generation") == entry.generation
+                )
+
+            if unchanged:
+                entry.mtime_ns, entry.size = stat.st_mtime_ns, stat.st_size
+                entry.checked_at = time.monotonic()
+                return entry
+
+        snapshot = read_snapshot(key)
+        if snapshot is None:
+            # Keep serving the last good snapshot over an unreadable file
+            return entry
+        return CachedSnapshot(snapshot, stat.st_mtime_ns, stat.st_size)
@@ -0,0 +1,100 @@
+import os
+import json
+import tempfile
+from pathlib import Path
+from datetime import datetime, timezone
+from typing import Any
+
+from .delta import SnapshotDelta
+from .store import _fsync_directory, read_snapshot_meta
+
+
+def append_change(
+    path: Path,
+    snapshot_path: Path,
+    delta: SnapshotDelta,
+    size: int = 50,
+) -> int:
+    """
+    Record ``delta`` as the change that produces the next generation of
+    ``snapshot_path``, keeping only the newest ``size`` entries.
+
+    Call it right before writing that snapshot, so a reader never sees a
+    generation that the change log does not cover yet. An entry left behind by
+    a failed snapshot write is replaced by the next attempt. Returns the
+    generation the entry was recorded for.
+    """
+    path = Path(path)
+    generation = (read_snapshot_meta(snapshot_path) or {}).get("generation", 0) + 1
+
+    entries = [e for e in read_changes(path) if e["generation"] < generation]
+    entries.append(
+        {
+            "generation": generation,
+            "scraped_at": datetime.now(timezone.utc).isoformat(),
+            "added": delta.added,
+            "changed": delta.changed,
+            "removed": delta.removed,
+        }
+    )
+    _write_json(path, {"changes": entries[-size:]})
+    return generation
+
+
+def read_changes(path: Path) -> list[dict[str, Any]]:
+    """Read a change log, oldest entry first; a missing or broken log is empty."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f).get("changes", [])
+    except (FileNotFoundError, json.JSONDecodeError, AttributeError):
+        return []
+
+
+def merge_changes(
+    entries: list[dict[str, Any]], since: int, until: int, key: str
+) -> tuple[list[dict[str, Any]], list[str]] | None:
+    """
+    Fold the changes from generation ``since`` up to ``until`` into the rows to
+    upsert and the keys to remove.
+
+    Returns None when the log does not cover every generation in between, in
+    which case the caller has to fall back to the full snapshot.
+    """
+    if since == until:
+        return [], []
+
+    window = [e for e in entries if since < e["generation"] <= until]
+    generations = [e["generation"] for e in window]
+    if generations != list(range(since + 1, until + 1)):
+        return None
+
+    rows, removed = {}, {}
+    for entry in window:
+        for row in entry["added"] + entry["changed"]:
+            rows[row[key]] = row
+            removed.pop(row[key], None)
+        for removed_key in entry["removed"]:
+            rows.pop(removed_key, None)
+            removed[removed_key] = None
+
+    return list(rows.values()), list(removed)
+
+
+def _write_json(path: Path, content: dict[str, Any]):
+    """Atomically replace ``path`` with ``content``, like ``write_snapshot``."""
+    os.makedirs(path.parent, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(content, f, ensure_ascii=False, separators=(",", ":"))
+            f.flush()
+            os.fsync(f.fileno())
+
+        os.chmod(tmp_path, 0o644)  # mkstemp creates owner-only files
+        os.replace(tmp_path, path)
+        _fsync_directory(path.parent)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
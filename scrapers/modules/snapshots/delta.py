@@ -0,0 +1,48 @@
+from typing import Any, NamedTuple
+
+
+class SnapshotDelta(NamedTuple):
+    """Per-instrument difference between two snapshots of a category."""
+
+    added: list[dict[str, Any]]
+    changed: list[dict[str, Any]]
+    removed: list[str]
+
+    @property
+    def has_changes(self) -> bool:
+        return bool(self.added or self.changed or self.removed)
+
+    @property
+    def moved(self) -> list[dict[str, Any]]:
+        """Instruments that are new or whose values changed."""
+        return self.added + self.changed
+
+
+def compute_delta(
+    previous: list[dict[str, Any]] | None,
+    current: list[dict[str, Any]],
+    key: str,
+    ignore: tuple[str, ...] = ("last_update", "numeric"),
+) -> SnapshotDelta:
+    """
+    Compare two snapshots instrument by instrument.
+
+    Instruments are matched on ``key`` (``title`` for TGJU, ``symbol`` for
+    ArzDigital); fields in ``ignore`` such as the scrape timestamp, or the
+    typed values derived from the display fields, do not count as a change.
+    """
+    previous_by_key = {item[key]: item for item in previous or []}
+    added, changed = [], []
+
+    for item in current:
+        old = previous_by_key.pop(item[key], None)
+        if old is None:
+            added.append(item)
+        elif any(
+            old.get(field) != value
+            for field, value in item.items()
+            if field not in ignore
+        ):
+            changed.append(item)
+
+    return SnapshotDelta(added=added, changed=changed, removed=list(previous_by_key))
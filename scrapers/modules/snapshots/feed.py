@@ -0,0 +1,98 @@
+import asyncio
+import weakref
+from pathlib import Path
+from django.conf import settings
+from typing import AsyncIterator
+
+from scrapers.modules.logger import LoggerFactory
+from .cache import CachedSnapshot, SnapshotCache
+
+logger = LoggerFactory.get_logger("SnapshotFeed", "scrapers/snapshots")
+
+
+class SnapshotFeed:
+    """
+    Push new generations of one snapshot file to async subscribers.
+
+    Scrapes are published by another process, so the feed polls the
+    ``SnapshotCache`` instead of listening for ``snapshot_published``. There is
+    one feed per event loop and path, and it only polls while someone is
+    subscribed, so any number of connections costs a single poller.
+    """
+
+    _feeds = weakref.WeakKeyDictionary()  # event loop -> {path: feed}
+
+    def __init__(self, path: Path | str, poll_interval: float = 1.0):
+        self.path = str(path)
+        self.poll_interval = poll_interval
+        self.current: CachedSnapshot | None = None
+
+        self._subscribers = 0
+        self._waiter: asyncio.Future | None = None
+        self._task: asyncio.Task | None = None
+
+    @classmethod
+    def for_path(cls, path: Path | str) -> "SnapshotFeed":
+        """Return the feed for ``path`` on the running event loop."""
+        feeds = cls._feeds.setdefault(asyncio.get_running_loop(), {})
+        feed = feeds.get(str(path))
+        if feed is None:
+            feed = feeds[str(path)] = cls(
+                path, poll_interval=settings.SCRAPER_STREAM_POLL_INTERVAL
+            )
+        return feed
+
+    async def updates(self) -> AsyncIterator[CachedSnapshot]:
+        """
+        Yield the current snapshot, then each newer one as it is published.
+
+        A subscriber that falls behind skips straight to the latest generation.
+        """
+        self._subscribers += 1
+        try:
+            if self._task is None:
+                # Nobody was listening, so the last known generation may be stale
+                self.current = await asyncio.to_thread(
+                    SnapshotCache.instance().get, self.path
+                )
+                self._ensure_poller()
+
+            seen = None
+            while True:
+                if self.current is None or self.current is seen:
+                    await self._changed()
+                    continue
+                seen = self.current
+                yield seen
+        finally:
+            self._subscribers -= 1
+
+    def _ensure_poller(self):
+        if self._task is None and self._subscribers:
+            self._task = asyncio.get_running_loop().create_task(self._poll())
+
+    async def _changed(self):
+        if self._waiter is None or self._waiter.done():
+            self._waiter = asyncio.get_running_loop().create_future()
+        # Shielded so one subscriber going away does not cancel the others
+        await asyncio.shield(self._waiter)
+
+    async def _poll(self):
+        cache = SnapshotCache.instance()
+        try:
+            while self._subscribers:
+                try:
+                    snapshot = await asyncio.to_thread(cache.get, self.path)
+                except Exception as e:
+                    # Keep polling: the file may be readable again next time
+                    logger.error(f"Failed to read snapshot {self.path}: {str(e)}")
+                    snapshot = None
+
+                if snapshot is not None and snapshot is not self.current:
+                    self.current = snapshot
+                    if self._waiter is not None and not self._waiter.done():
+                        self._waiter.set_result(None)
+                await asyncio.sleep(self.poll_interval)
+        finally:
+            # Let the next subscriber start a new poller whatever happened
+            self._task = None
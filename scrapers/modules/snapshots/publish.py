@@ -0,0 +1,67 @@
+from pathlib import Path
+from typing import Any
+from django.conf import settings
+
+from scrapers.signals import snapshot_published
+from scrapers.modules.logger import LoggerFactory
+from scrapers.modules.normalize import normalize_rows
+from .delta import SnapshotDelta, compute_delta
+from .changes import append_change
+from .store import read_snapshot, write_snapshot
+
+logger = LoggerFactory.get_logger("SnapshotPublisher", "scrapers/snapshots")
+
+
+def publish_snapshot(
+    output_dir: Path,
+    source: str,
+    category: str,
+    data: list[dict[str, Any]],
+    key: str,
+    sender: Any = None,
+) -> SnapshotDelta | None:
+    """
+    Publish a category's rows to ``<output_dir>/<category>.json``.
+
+    The rows are normalized, then compared with the current snapshot on
+    ``key``. Nothing is written unless an instrument moved; otherwise the
+    delta is appended to the change log, the snapshot is written and
+    ``snapshot_published`` is sent. Returns the delta, or None without rows.
+    """
+    if not data:
+        return None
+
+    # Type the prices once, so listeners and readers never parse them again
+    data = normalize_rows(data)
+
+    output_dir = Path(output_dir)
+    path = output_dir / f"{category}.json"
+    previous = read_snapshot(path)
+    delta = compute_delta(previous.data if previous else None, data, key=key)
+    if not delta.has_changes:
+        logger.info(f"No {source} {category} instrument moved, keeping {path.name}.")
+        return delta
+
+    # Log the change first, so every published generation is covered by it
+    append_change(
+        output_dir / f"{category}.changes.json",
+        path,
+        delta,
+        size=settings.SCRAPER_CHANGE_LOG_SIZE,
+    )
+    meta = write_snapshot(
+        path,
+        data,
+        source=source,
+        category=category,
+        compact=settings.SCRAPER_SNAPSHOT_COMPACT,
+    )
+    snapshot_published.send(
+        sender=sender,
+        source=source,
+        category=category,
+        data=data,
+        delta=delta,
+        meta=meta,
+    )
+    return delta
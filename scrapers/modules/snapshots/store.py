@@ -0,0 +1,129 @@
+import os
+import re
+import json
+import tempfile
+from pathlib import Path
+from datetime import datetime, timezone
+from typing import Any, Iterable, NamedTuple
+
+META_PATTERN = re.compile(r'^\s*\{\s*"meta"\s*:\s*')
+META_READ_SIZE = 4096
+
+
+class Snapshot(NamedTuple):
+    """A published category snapshot: its metadata header and its rows."""
+
+    meta: dict[str, Any]
+    data: list[dict[str, Any]]
+
+    @property
+    def generation(self) -> int:
+        return self.meta.get("generation", 0)
+
+
+def write_snapshot(
+    path: Path,
+    rows: Iterable[dict[str, Any]],
+    source: str,
+    category: str,
+    compact: bool = True,
+) -> dict[str, Any] | None:
+    """
+    Atomically publish rows to ``path`` behind a small metadata header.
+
+    The file is written to a temporary file in the same directory, fsynced and
+    renamed over the target, so readers see either the old or the new snapshot
+    and never a truncated one. Rows are written one at a time, so ``rows`` may
+    be a generator. If no row was written the previous snapshot is kept and
+    None is returned.
+    """
+    path = Path(path)
+    os.makedirs(path.parent, exist_ok=True)
+
+    previous = read_snapshot_meta(path)
+    meta = {
+        "generation": (previous or {}).get("generation", 0) + 1,
+        "scraped_at": datetime.now(timezone.utc).isoformat(),
+        "source": source,
+        "category": category,
+    }
+
+    dumps_kwargs = (
+        {"ensure_ascii": False, "separators": (",", ":")}
+        if compact
+        else {"ensure_ascii": False, "indent": 4}
+    )
+    row_separator = "," if compact else ",\n"
+
+    fd, tmp_path = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+    )
+    count = 0
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write('{"meta":' if compact else '{\n"meta": ')
+            f.write(json.dumps(meta, **dumps_kwargs))
+            f.write(',"data":[' if compact else ',\n"data": [\n')
+            for row in rows:
+                if count:
+                    f.write(row_separator)
+                f.write(json.dumps(row, **dumps_kwargs))
+                count += 1
+            f.write("]}" if compact else "\n]\n}\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+        if not count:
+            return None
+
+        os.chmod(tmp_path, 0o644)  # mkstemp creates owner-only files
+        os.replace(tmp_path, path)
+        _fsync_directory(path.parent)
+        return meta
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def read_snapshot(path: Path) -> Snapshot | None:
+    """Read a snapshot file, accepting the legacy bare-list format as generation 0."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            content = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+    if isinstance(content, list):
+        return Snapshot(meta={"generation": 0}, data=content)
+    return Snapshot(meta=content.get("meta", {}), data=content.get("data", []))
+
+
+def read_snapshot_meta(path: Path) -> dict[str, Any] | None:
+    """Read only the metadata header from the start of a snapshot file."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            head = f.read(META_READ_SIZE)
+    except FileNotFoundError:
+        return None
+
+    match = META_PATTERN.match(head)
+    if not match:
+        # Legacy bare-list snapshot (or an unreadable file)
+        return {"generation": 0} if head.lstrip().startswith("[") else None
+
+    try:
+        meta, _ = json.JSONDecoder().raw_decode(head, match.end())
+    except json.JSONDecodeError:
+        return None
+    return meta
+
+
+def _fsync_directory(directory: Path):
+    """Persist the rename itself; not supported (nor needed) on Windows."""
+    if os.name == "nt":
+        return
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
@@ -1,9 +1,9 @@
-import os
-import json
 from django.conf import settings
 from .coin import TGJUCoinScraper
 from .gold import TGJUGoldScraper
 from .currency import TGJUCurrencyScraper
+from scrapers.modules.runner import ScraperRunner
+from scrapers.modules.snapshots import publish_snapshot
 
 SCRAPERS_OUTPUT_DIR = settings.BASE_DIR / "scrapers_output" / "tgju"
 
@@ -13,52 +13,77 @@ class TGJUScraperManager:
         self.coin_scraper = TGJUCoinScraper()
         self.gold_scraper = TGJUGoldScraper()
         self.currency_scraper = TGJUCurrencyScraper()
+        self.errors = {}
 
-    def _save_to_file(self, data, filename: str):
-        """Internal method to save data to a JSON file."""
-        if data:
-            path = SCRAPERS_OUTPUT_DIR / filename
-            os.makedirs(path.parent, exist_ok=True)
-            with open(path, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=4)
+    def _publish(self, data, category: str):
+        """Publish a category if at least one instrument changed since the last save."""
+        return publish_snapshot(
+            SCRAPERS_OUTPUT_DIR,
+            "tgju",
+            category,
+            data,
+            key="title",
+            sender=self.__class__,
+        )
+
+    def _fetch(self, scraper):
+        """Scrape with ``scraper``, raising on failure so the runner reports it."""
+        data = scraper.fetch_data()
+        if data is None:
+            raise RuntimeError(f"{scraper.scraper_type} scrape failed")
+        return data
 
     def get_coin_data(self, save: bool = True):
-        data = self.coin_scraper.fetch_data()
+        data = self._fetch(self.coin_scraper)
         if save:
-            self._save_to_file(data, "coin.json")
+            self._publish(data, "coin")
         else:
             return data
 
     def get_gold_data(self, save: bool = True):
-        data = self.gold_scraper.fetch_data()
+        data = self._fetch(self.gold_scraper)
         if save:
-            self._save_to_file(data, "gold.json")
+            self._publish(data, "gold")
         else:
             return data
 
     def get_currency_data(self, save: bool = True):
-        data = self.currency_scraper.fetch_data()
+        data = self._fetch(self.currency_scraper)
         if save:
-            self._save_to_file(data, "currency.json")
+            self._publish(data, "currency")
         else:
             return data
 
-    def run(self, coins=False, gold=False, crypto=False, currency=False, save=True):
-        """Run the selected scrapers. If no specific flag is given, scrape all."""
-        results = {}
+    def run(
+        self,
+        coins=False,
+        gold=False,
+        crypto=False,
+        currency=False,
+        save=True,
+        parallel=False,
+        max_workers=None,
+    ):
+        """
+        Run the selected scrapers. If no specific flag is given, scrape all.
+
+        With ``parallel`` the categories are scraped concurrently on up to
+        ``max_workers`` threads; per-category failures are kept in ``self.errors``.
+        """
         # If no specific flags are provided, scrape all
         if not (coins or gold or currency):
-            results["coins"] = self.get_coin_data(save=save)
-            results["gold"] = self.get_gold_data(save=save)
-            results["currency"] = self.get_currency_data(save=save)
-        else:
-            if coins:
-                results["coins"] = self.get_coin_data(save=save)
+            coins = gold = currency = True
+
+        tasks = {}
+        if coins:
+            tasks["coins"] = lambda: self.get_coin_data(save=save)
 
-            if gold:
-                results["gold"] = self.get_gold_data(save=save)
+        if gold:
+            tasks["gold"] = lambda: self.get_gold_data(save=save)
 
-            if currency:
-                results["currency"] = self.get_currency_data(save=save)
+        if currency:
+            tasks["currency"] = lambda: self.get_currency_data(save=save)
 
-        return results
+        report = ScraperRunner(max_workers=max_workers).run(tasks, parallel=parallel)
+        self.errors = report.errors
+        return report.results
@@ -1,2 +1,4 @@
 from .tgju_serializers import TGJUDataSerializer
 from .coinex_serializer import ArzDigitalDataSerializer
+from .candle_serializer import PriceCandleSerializer
+from .derived_serializer import DerivedRateSerializer
@@ -0,0 +1,14 @@
+from rest_framework import serializers
+from scrapers.models import PriceCandle
+
+
+class PriceCandleSerializer(serializers.ModelSerializer):
+    open = serializers.DecimalField(28, 8, normalize_output=True)
+    high = serializers.DecimalField(28, 8, normalize_output=True)
+    low = serializers.DecimalField(28, 8, normalize_output=True)
+    close = serializers.DecimalField(28, 8, normalize_output=True)
+    closed = serializers.BooleanField(source="is_closed")
+
+    class Meta:
+        model = PriceCandle
+        fields = ["open_time", "open", "high", "low", "close", "samples", "closed"]
@@ -0,0 +1,10 @@
+from rest_framework import serializers
+
+
+class DerivedRateSerializer(serializers.Serializer):
+    symbol = serializers.CharField()
+    name = serializers.CharField()
+    name_fa = serializers.CharField()
+    value = serializers.CharField()
+    unit = serializers.CharField(allow_blank=True)
+    last_update = serializers.CharField()
@@ -0,0 +1,6 @@
+from django.dispatch import Signal
+
+# Sent by publish_snapshot after a category snapshot has been written.
+# Arguments: source ("tgju" / "arzdigital" / "derived"), category, data, delta (SnapshotDelta),
+# meta (the snapshot header: generation, scraped_at, ...)
+snapshot_published = Signal()
@@ -1,3 +1,105 @@
-from django.test import TestCase
+from django.test import SimpleTestCase
 
-# Create your tests here.
+from scrapers.modules.parsers import get_row_parser
+from scrapers.modules.tgju import TGJUCoinScraper, TGJUCurrencyScraper, TGJUGoldScraper
+from scrapers.modules.arzdigital import ArzDigitalCryptoScraper, ArzDigitalMarketScraper
+
+TGJU_PAGE = """
+<html><head><title>TGJU</title></head><body>
+<div class="market-table"><p>Prices</p></div>
+<table class="data-table market-table">
+<thead><tr class="market-head"><th>title</th><th>price</th></tr></thead>
+<tbody>
+<tr data-market-row="price_dollar_rl" class="market-row odd">
+<th>دلار</th><td class="nf">820,000</td>
+<td class="nf"><span class="high">(0.49%) 4,000</span></td><td>12:00</td></tr>
+<tr data-market-row="price_eur" class="market-row">
+<th>یورو</th><td class="nf">900,500</td>
+<td class="nf"><span class="low">(1.2%) 10,000</span></td><td>12:00</td></tr>
+<tr data-market-row="price_cny"><th>یوان چین</th><td class="nf">115,000</td>
+<td class="nf">0</td><td>12:00</td></tr>
+<tr data-market-row="sekee"><th>سکه امامی</th><td class="nf">700,000,000</td>
+<td class="nf"><span class="high">(2%) 14,000,000</span></td><td>12:00</td></tr>
+<tr data-market-row="geram18"><th>طلای 18 عیار / 750</th><td class="nf">65,000,000</td>
+<td class="nf"><span class="low">(0.1%) 65,000</span></td><td>12:00</td></tr>
+<tr data-market-row="mesghal"><th>مثقال طلا</th><td class="nf">280,000,000</td>
+<td class="nf"><span class="high">(0.3%) 800,000</span></td><td>12:00</td></tr>
+<tr class="market-row"><th>دلار</th><td class="nf">1</td><td class="nf">0</td></tr>
+</tbody></table></body></html>
+"""
+
+ARZDIGITAL_ROW = """
+<tr class="arz-coin-tr arz-sort-value-row{extra}" data-symbol="{symbol}">
+<td class="arz-coin-table__name-td"><a><img/><span>{name}</span></a></td>
+<td class="arz-coin-table__price-td"><span>{usd}</span></td>
+<td class="arz-coin-table__rial-price-td"><span>{irt} ت</span></td>
+<td class="arz-coin-table__marketcap-td"><span dir="auto">{cap}</span></td>
+<td class="arz-coin-table__daily-swing-td"><span class="{swing}">{change}</span></td>
+</tr>
+"""
+
+ARZDIGITAL_PAGE = (
+    '<html><body><table class="arz-coin-table"><thead>'
+    '<tr class="arz-coin-tr-head"><th>name</th></tr></thead><tbody>'
+    + ARZDIGITAL_ROW.format(
+        extra="",
+        symbol="BTC",
+        name="Bitcoin",
+        usd="$65,000.12",
+        irt="۵,۰۰۰,۰۰۰,۰۰۰",
+        cap="$1.2T",
+        swing="arz-positive",
+        change="2.5%",
+    )
+    + ARZDIGITAL_ROW.format(
+        extra=" arz-coin-tr--pinned",
+        symbol="USDT",
+        name="Tether USDt",
+        usd="$1.00",
+        irt="85,000",
+        cap="$110B",
+        swing="arz-negative",
+        change="0.01%",
+    )
+    + ARZDIGITAL_ROW.format(
+        extra="",
+        symbol="SHIB",
+        name="Shiba Inu",
+        usd="$0.00001",
+        irt="1",
+        cap="$1B",
+        swing="arz-positive",
+        change="3%",
+    )
+    + "</tbody></table></body></html>"
+)
+
+
+class RowParserBackendTests(SimpleTestCase):
+    """Every parser backend must hand the scrapers the same rows."""
+
+    BACKENDS = ("html.parser", "strainer", "lxml")
+
+    def assertSameRows(self, scraper, content: str, count: int):
+        outputs = {}
+        for backend in self.BACKENDS:
+            scraper.row_parser = get_row_parser(backend)
+            rows = scraper._process_rows(scraper._extract_rows(content))
+            outputs[backend] = [
+                {field: value for field, value in row.items() if field != "last_update"}
+                for row in rows
+            ]
+
+        self.assertEqual(len(outputs["html.parser"]), count)
+        for backend in self.BACKENDS[1:]:
+            with self.subTest(scraper=scraper.scraper_type, backend=backend):
+                self.assertEqual(outputs[backend], outputs["html.parser"])
+
+    def test_tgju_rows(self):
+        self.assertSameRows(TGJUCurrencyScraper(), TGJU_PAGE, count=3)
+        self.assertSameRows(TGJUCoinScraper(), TGJU_PAGE, count=1)
+        self.assertSameRows(TGJUGoldScraper(), TGJU_PAGE, count=2)
+
+    def test_arzdigital_rows(self):
+        self.assertSameRows(ArzDigitalCryptoScraper(), ARZDIGITAL_PAGE, count=2)
+        self.assertSameRows(ArzDigitalMarketScraper(), ARZDIGITAL_PAGE, count=3)
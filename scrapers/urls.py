@@ -1,5 +1,14 @@
 from django.urls import path
+from scrapers.views.market_views import MarketBatchView
+from scrapers.views.history_views import (
+    CandleView,
+    PriceHistoryView,
+    PriceHistoryExportView,
+)
+from scrapers.views.stream_views import MarketStreamView
 from scrapers.views.arz_digital_views import ArzdigitalCryptoView
+from scrapers.views.derived_views import DerivedRatesView
+from scrapers.views.conversion_views import ConversionView
 from scrapers.views.tgju_views import TGJUCoinView, TGJUGoldView, TGJUCurrencyView
 
 urlpatterns = [
@@ -9,4 +18,15 @@ urlpatterns = [
     path(
         "arzdigital/crypto/", ArzdigitalCryptoView.as_view(), name="arzdigital-crypto"
     ),
+    path("derived/rates/", DerivedRatesView.as_view(), name="derived-rates"),
+    path("convert/", ConversionView.as_view(), name="market-convert"),
+    path("batch/", MarketBatchView.as_view(), name="market-batch"),
+    path("candles/<str:category>/", CandleView.as_view(), name="market-candles"),
+    path("history/<str:category>/", PriceHistoryView.as_view(), name="market-history"),
+    path(
+        "history/<str:category>/export/",
+        PriceHistoryExportView.as_view(),
+        name="market-history-export",
+    ),
+    path("stream/<str:category>/", MarketStreamView.as_view(), name="market-stream"),
 ]
@@ -0,0 +1,98 @@
+import os
+from typing import NamedTuple
+from django.conf import settings
+from rest_framework.serializers import Serializer
+
+from scrapers.serializers import (
+    ArzDigitalDataSerializer,
+    DerivedRateSerializer,
+    TGJUDataSerializer,
+)
+
+SCRAPERS_OUTPUT_DIR = settings.BASE_DIR / "scrapers_output"
+
+
+class MarketCategory(NamedTuple):
+    """A scraped snapshot served by the API, and how its responses are worded."""
+
+    source: str
+    name: str
+    serializer_class: type[Serializer]
+    label: str
+    not_found_message: str
+    key_field: str
+
+    @property
+    def path(self) -> str:
+        return os.path.join(SCRAPERS_OUTPUT_DIR, self.source, f"{self.name}.json")
+
+    @property
+    def changes_path(self) -> str:
+        return os.path.join(
+            SCRAPERS_OUTPUT_DIR, self.source, f"{self.name}.changes.json"
+        )
+
+    @property
+    def filter_param(self) -> str:
+        """Query parameter selecting rows by ``key_field`` (``titles`` or ``symbols``)."""
+        return f"{self.key_field}s"
+
+    @property
+    def fields(self) -> list[str]:
+        return list(self.serializer_class().fields)
+
+    @property
+    def message(self) -> str:
+        return f"{self.label} data retrieved successfully."
+
+    @property
+    def error_message(self) -> str:
+        return f"Error retrieving {self.label} data"
+
+
+# Keyed by category name, which is also the TelegramCommand command_type
+MARKET_CATEGORIES = {
+    category.name: category
+    for category in (
+        MarketCategory(
+            "tgju",
+            "coin",
+            TGJUDataSerializer,
+            "TGJU coin",
+            "Coin data file not found.",
+            "title",
+        ),
+        MarketCategory(
+            "tgju",
+            "gold",
+            TGJUDataSerializer,
+            "TGJU gold",
+            "Gold data file not found.",
+            "title",
+        ),
+        MarketCategory(
+            "tgju",
+            "currency",
+            TGJUDataSerializer,
+            "TGJU currency",
+            "Currency data file not found.",
+            "title",
+        ),
+        MarketCategory(
+            "arzdigital",
+            "crypto",
+            ArzDigitalDataSerializer,
+            "ArzDigital crypto",
+            "crypto data file not found.",
+            "symbol",
+        ),
+        MarketCategory(
+            "derived",
+            "rates",
+            DerivedRateSerializer,
+            "Derived rates",
+            "Derived rates file not found.",
+            "symbol",
+        ),
+    )
+}
@@ -0,0 +1,87 @@
+import math
+from decimal import Decimal, InvalidOperation
+from rest_framework import status
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from scrapers.modules.conversion import CONVERSION_SOURCES, RateMatrixCache
+from scrapers.modules.snapshots import SnapshotCache
+from scrapers.views.categories import MARKET_CATEGORIES
+from scrapers.views.market_views import MeteredView
+
+
+def get_rate_matrix():
+    """The rate matrix of the latest currency and crypto snapshots."""
+    snapshots, key = {}, []
+    for source, category, _, _ in CONVERSION_SOURCES:
+        snapshot = SnapshotCache.instance().get(MARKET_CATEGORIES[category].path)
+        snapshots[(source, category)] = snapshot.data if snapshot else []
+        key.append(
+            (snapshot.generation, snapshot.meta.get("scraped_at")) if snapshot else None
+        )
+    return RateMatrixCache.instance().get(tuple(key), snapshots)
+
+
+class ConversionView(MeteredView):
+    """
+    Convert an amount between two instruments.
+
+    Parameters: ``from`` and ``to`` (TGJU currency titles, ArzDigital crypto
+    symbols, ``IRR`` or ``IRT``) and ``amount`` (default 1).
+    """
+
+    command_type = "convert"
+
+    def respond(self, request: Request):
+        base = request.query_params.get("from", "")
+        quote = request.query_params.get("to", "")
+        if not base or not quote:
+            return Response(
+                {"message": "from and to not provided."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            amount = Decimal(request.query_params.get("amount", "1"))
+        except InvalidOperation:
+            amount = None
+        if amount is None or not amount.is_finite():
+            return Response(
+                {"message": "amount must be a number."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        matrix = get_rate_matrix()
+        rate = matrix.rate(base, quote)
+        if rate is None:
+            unknown = base if matrix.position(base) is None else quote
+            return Response(
+                {
+                    "message": f"Unknown instrument: {unknown}.",
+                    "available": matrix.instruments,
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        # Amounts beyond the float range cannot be rendered as JSON
+        result = float(amount) * rate
+        if not math.isfinite(result):
+            return Response(
+                {"message": "amount is out of range."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        return Response(
+            {
+                "from": matrix.instruments[matrix.position(base)],
+                "to": matrix.instruments[matrix.position(quote)],
+                "amount": float(amount),
+                "rate": rate,
+                "result": result,
+                "message": "Amount converted successfully.",
+            },
+            status=status.HTTP_200_OK,
+        )
+
+    def get_error_message(self) -> str:
+        return "Error converting the amount"
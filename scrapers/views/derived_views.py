@@ -0,0 +1,6 @@
+from scrapers.views.market_views import MarketDataView
+from scrapers.views.categories import MARKET_CATEGORIES
+
+
+class DerivedRatesView(MarketDataView):
+    category = MARKET_CATEGORIES["rates"]
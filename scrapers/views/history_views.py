@@ -0,0 +1,390 @@
+import csv
+import json
+import numpy as np
+from abc import abstractmethod
+from datetime import datetime, timedelta, timezone
+from django.conf import settings
+from django.http import StreamingHttpResponse
+from django.utils import timezone as django_timezone
+from django.utils.dateparse import parse_datetime
+from rest_framework import status
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from scrapers.models import PriceCandle, PricePoint
+from scrapers.modules.history import (
+    PRICE_FIELDS,
+    ColumnarHistory,
+    bucket_start,
+    fill_candles,
+    lttb,
+    summarize,
+)
+from scrapers.modules.normalize import FIELD_KINDS, numeric_value
+from scrapers.serializers import PriceCandleSerializer
+from scrapers.views.categories import MARKET_CATEGORIES, MarketCategory
+from scrapers.views.market_views import MeteredView, split_param
+
+MAX_HISTORY_LIMIT = 5000
+MAX_HISTORY_INSTRUMENTS = 20
+EXPORT_FORMATS = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+
+def get_instruments(
+    request: Request, category: MarketCategory, required: bool = True
+) -> tuple[list[str] | None, Response | None]:
+    """
+    Read the ``instrument`` or ``instruments`` parameter: TGJU titles or
+    ArzDigital symbols, comma-separated.
+    """
+    instruments = split_param(
+        request.query_params.get("instruments")
+        or request.query_params.get("instrument")
+    )
+    if category.key_field == "symbol":
+        instruments = [instrument.upper() for instrument in instruments]
+    instruments = list(dict.fromkeys(instruments))
+
+    if required and not instruments:
+        return None, Response(
+            {"message": f"instrument ({category.key_field}) not provided."},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+    if len(instruments) > MAX_HISTORY_INSTRUMENTS:
+        return None, Response(
+            {"message": f"At most {MAX_HISTORY_INSTRUMENTS} instruments per request."},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+    return instruments, None
+
+
+def get_time_range(request: Request) -> tuple[dict | None, Response | None]:
+    """Read the optional ISO 8601 ``start`` and ``end`` parameters as filters."""
+    time_range = {}
+    for param, lookup in (("start", "gte"), ("end", "lt")):
+        value = request.query_params.get(param)
+        if not value:
+            continue
+        moment = parse_datetime(value)
+        if moment is None:
+            return None, Response(
+                {"message": f"{param} must be an ISO 8601 date and time."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if django_timezone.is_naive(moment):
+            moment = django_timezone.make_aware(moment)
+        time_range[lookup] = moment
+    return time_range, None
+
+
+def get_limit(
+    request: Request, default: int, param: str = "limit", minimum: int = 1
+) -> tuple[int | None, Response | None]:
+    try:
+        limit = int(request.query_params.get(param, default))
+    except ValueError:
+        limit = 0
+    if not minimum <= limit <= MAX_HISTORY_LIMIT:
+        return None, Response(
+            {"message": f"{param} must be between {minimum} and {MAX_HISTORY_LIMIT}."},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+    return limit, None
+
+
+def value_fields(category: MarketCategory) -> list[str]:
+    """Fields stored in a category's price points."""
+    return [
+        field
+        for field in category.fields
+        if field not in (category.key_field, "last_update")
+    ]
+
+
+class HistoryView(MeteredView):
+    """Base for the read-only history endpoints of a market category."""
+
+    def get(self, request: Request, category: str, *args, **kwargs):
+        market_category = MARKET_CATEGORIES.get(category)
+        if market_category is None:
+            return Response(
+                {"message": f"Unknown category: {category}."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+        return super().get(request, market_category)
+
+    @abstractmethod
+    def respond(self, request: Request, category: MarketCategory):
+        """Build the response for a known category and an allowed user."""
+        pass
+
+    def get_error_message(self, category: MarketCategory) -> str:
+        return f"Error retrieving {category.label} history"
+
+
+class CandleView(HistoryView):
+    """
+    OHLC candles of one instrument.
+
+    Parameters: ``instrument``, ``resolution`` (1m, 15m, 1h or 1d; default
+    1h), optional ``start``/``end`` and ``limit`` (the most recent candles in
+    the range, default 500).
+
+    Every bucket of the range has a candle: candles are only written when the
+    instrument is published, so buckets without one are flat candles at the
+    previous close with ``samples`` 0.
+    """
+
+    serializer_class = PriceCandleSerializer
+    command_type = "candles"
+
+    def respond(self, request: Request, category: MarketCategory):
+        instruments, error = get_instruments(request, category)
+        if error is not None:
+            return error
+        instrument = instruments[0]
+
+        resolution = request.query_params.get("resolution", "1h")
+        if resolution not in PriceCandle.RESOLUTION_SECONDS:
+            return Response(
+                {
+                    "message": f"Unknown resolution: {resolution}.",
+                    "available": list(PriceCandle.RESOLUTION_SECONDS),
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        time_range, error = get_time_range(request)
+        if error is not None:
+            return error
+
+        limit, error = get_limit(request, default=500)
+        if error is not None:
+            return error
+
+        # The last ``limit`` buckets starting in the range, up to the current one
+        step = timedelta(seconds=PriceCandle.RESOLUTION_SECONDS[resolution])
+        now = django_timezone.now()
+        end = min(time_range.get("lt", now), now)
+        last_open = bucket_start(end - timedelta(microseconds=1), resolution)
+        first_open = last_open - step * (limit - 1)
+        if "gte" in time_range:
+            start_open = bucket_start(time_range["gte"], resolution)
+            if start_open < time_range["gte"]:
+                start_open += step
+            first_open = max(first_open, start_open)
+
+        candles = PriceCandle.objects.filter(
+            category=category.name, instrument=instrument, resolution=resolution
+        )
+        candles = fill_candles(
+            list(candles.filter(open_time__gte=first_open, open_time__lte=last_open)),
+            candles.filter(open_time__lt=first_open).order_by("-open_time").first(),
+            first_open,
+            last_open,
+            resolution,
+        )
+
+        return Response(
+            {
+                "instrument": instrument,
+                "resolution": resolution,
+                "data": self.get_serializer(candles, many=True).data,
+                "message": f"{category.label} candles retrieved successfully.",
+            },
+            status=status.HTTP_200_OK,
+        )
+
+
+class PriceHistoryView(HistoryView):
+    """
+    Price points of one or more instruments, downsampled for charting.
+
+    Parameters: ``instruments``, optional ``field`` (defaults to the price),
+    ``start``/``end`` and ``points``. Series longer than ``points`` (default
+    500) are reduced with LTTB, keeping their peaks and troughs. Prices are
+    read from the columnar history when it is enabled.
+
+    ``summary`` holds each instrument's open, high, low, close, mean and count
+    over the whole range, computed before downsampling.
+    """
+
+    command_type = "history"
+
+    def respond(self, request: Request, category: MarketCategory):
+        instruments, error = get_instruments(request, category)
+        if error is not None:
+            return error
+
+        fields = [field for field in value_fields(category) if field in FIELD_KINDS]
+        field = request.query_params.get("field", PRICE_FIELDS[category.source])
+        if field not in fields:
+            return Response(
+                {"message": f"Unknown field: {field}.", "available": fields},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        time_range, error = get_time_range(request)
+        if error is not None:
+            return error
+
+        points, error = get_limit(request, default=500, param="points", minimum=3)
+        if error is not None:
+            return error
+
+        columnar = (
+            settings.SCRAPER_COLUMNAR_HISTORY_ENABLED
+            and field == PRICE_FIELDS[category.source]
+        )
+
+        data, summary = {}, {}
+        for instrument in instruments:
+            if columnar:
+                series = self._columnar_series(category, instrument, time_range)
+                summary[instrument] = ColumnarHistory.instance().summary(
+                    category.name,
+                    instrument,
+                    start=time_range.get("gte"),
+                    end=time_range.get("lt"),
+                )
+            else:
+                series = self._point_series(category, instrument, field, time_range)
+                summary[instrument] = summarize(np.array([y for _, y in series]))
+
+            data[instrument] = [
+                {
+                    "timestamp": datetime.fromtimestamp(x, tz=timezone.utc).isoformat(),
+                    "value": y,
+                }
+                for x, y in lttb(series, points)
+            ]
+
+        return Response(
+            {
+                "field": field,
+                "data": data,
+                "summary": summary,
+                "message": f"{category.label} history retrieved successfully.",
+            },
+            status=status.HTTP_200_OK,
+        )
+
+    def _columnar_series(
+        self, category: MarketCategory, instrument: str, time_range: dict
+    ) -> list[tuple[float, float]]:
+        records = ColumnarHistory.instance().read(
+            category.name,
+            instrument,
+            start=time_range.get("gte"),
+            end=time_range.get("lt"),
+        )
+        return list(zip(records["timestamp"].tolist(), records["price"].tolist()))
+
+    def _point_series(
+        self, category: MarketCategory, instrument: str, field: str, time_range: dict
+    ) -> list[tuple[float, float]]:
+        rows = (
+            PricePoint.objects.filter(
+                category=category.name,
+                instrument=instrument,
+                **{
+                    f"timestamp__{lookup}": moment
+                    for lookup, moment in time_range.items()
+                },
+            )
+            .order_by("timestamp")
+            .values_list("timestamp", "values")
+            .iterator(chunk_size=2000)
+        )
+
+        series = []
+        for timestamp, values in rows:
+            number = numeric_value(values, field)
+            if number is not None:
+                series.append((timestamp.timestamp(), float(number)))
+        return series
+
+
+class Echo:
+    """File-like object whose ``write`` returns the data, for streaming csv."""
+
+    def write(self, value):
+        return value
+
+
+class PriceHistoryExportView(HistoryView):
+    """
+    Stream the raw price points of a category as NDJSON or CSV.
+
+    Parameters: ``output`` (ndjson or csv; ``format`` is taken by DRF),
+    optional ``instruments`` and ``start``/``end``. Rows are read with
+    ``.iterator()`` and written as they arrive, so memory use does not grow
+    with the range.
+    """
+
+    command_type = "export"
+
+    def respond(self, request: Request, category: MarketCategory):
+        output = request.query_params.get("output", "ndjson")
+        if output not in EXPORT_FORMATS:
+            return Response(
+                {
+                    "message": f"Unknown output: {output}.",
+                    "available": list(EXPORT_FORMATS),
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        instruments, error = get_instruments(request, category, required=False)
+        if error is not None:
+            return error
+
+        time_range, error = get_time_range(request)
+        if error is not None:
+            return error
+
+        points = PricePoint.objects.filter(
+            category=category.name,
+            **{f"timestamp__{lookup}": moment for lookup, moment in time_range.items()},
+        )
+        if instruments:
+            points = points.filter(instrument__in=instruments)
+        rows = (
+            points.order_by("timestamp", "instrument")
+            .values_list("instrument", "timestamp", "generation", "values")
+            .iterator(chunk_size=2000)
+        )
+
+        if output == "csv":
+            content = self._csv_lines(rows, value_fields(category))
+        else:
+            content = self._ndjson_lines(rows)
+
+        response = StreamingHttpResponse(content, content_type=EXPORT_FORMATS[output])
+        response["Content-Disposition"] = (
+            f'attachment; filename="{category.name}-history.{output}"'
+        )
+        return response
+
+    def _ndjson_lines(self, rows):
+        for instrument, timestamp, generation, values in rows:
+            line = {
+                "instrument": instrument,
+                "timestamp": timestamp.isoformat(),
+                "generation": generation,
+                **values,
+            }
+            yield json.dumps(line, ensure_ascii=False) + "\n"
+
+    def _csv_lines(self, rows, fields: list[str]):
+        writer = csv.writer(Echo())
+        yield writer.writerow(["instrument", "timestamp", "generation", *fields])
+        for instrument, timestamp, generation, values in rows:
+            yield writer.writerow(
+                [
+                    instrument,
+                    timestamp.isoformat(),
+                    generation,
+                    *(values.get(field, "") for field in fields),
+                ]
+            )
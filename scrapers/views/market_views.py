@@ -0,0 +1,326 @@
+from abc import ABC, abstractmethod
+from rest_framework import status
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.generics import GenericAPIView
+from rest_framework.throttling import ScopedRateThrottle
+
+from scrapers.views.responses import (
+    Selection,
+    batch_response,
+    changes_response,
+    query_user_id,
+    not_modified_response,
+    snapshot_response,
+)
+from scrapers.modules.snapshots import SnapshotCache
+from scrapers.views.categories import MARKET_CATEGORIES, MarketCategory
+from api_keys.authentication import APIKeyAuthentication
+from telegram.models import TelegramCommand, TelegramUser
+
+
+def get_requesting_user(tg_user_id) -> tuple[TelegramUser | None, Response | None]:
+    """Look up the Telegram user behind a request and check its quota."""
+    if not tg_user_id:
+        return None, Response(
+            {"message": "TG user ID not provided."},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+    tg_user = TelegramUser.objects.filter(user_id=tg_user_id).first()
+    if not tg_user:
+        return None, Response(
+            {"message": "TG user not found."},
+            status=status.HTTP_404_NOT_FOUND,
+        )
+
+    if not tg_user.can_make_request():
+        return None, Response(
+            {"message": "TG user cannot make a request."},
+            status=status.HTTP_403_FORBIDDEN,
+        )
+
+    return tg_user, None
+
+
+class MeteredView(GenericAPIView, ABC):
+    """
+    Base for endpoints charged to the requesting Telegram user: the quota is
+    checked first and a request is only charged once its response is a 200,
+    so errors and 304s are free.
+    """
+
+    http_method_names = ["get"]
+    authentication_classes = [APIKeyAuthentication]
+
+    throttle_scope = "user"
+    throttle_classes = [ScopedRateThrottle]
+
+    # TelegramCommand type recorded for each charged request
+    command_type: str = None
+
+    def get(self, request: Request, *args, **kwargs):
+        return self.metered_response(request, query_user_id(request), *args, **kwargs)
+
+    def metered_response(self, request: Request, tg_user_id, *args, **kwargs):
+        """Check the user's quota, build the response and charge it if it succeeded."""
+        try:
+            # Check if the user is allowed to make a request
+            tg_user, error = get_requesting_user(tg_user_id)
+            if error is not None:
+                return error
+
+            response = self.respond(request, *args, **kwargs)
+            if response.status_code == status.HTTP_200_OK:
+                self.charge(request, tg_user, *args, **kwargs)
+            return response
+        except Exception as e:
+            return Response(
+                {"message": self.get_error_message(*args, **kwargs)},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+    def charge(self, request: Request, tg_user: TelegramUser, *args, **kwargs):
+        """Record the request's commands and count it against the user's quota."""
+        # Create the commands for the user
+        TelegramCommand.objects.bulk_create(
+            TelegramCommand(tg_user=tg_user, command_type=command_type)
+            for command_type in self.get_command_types(request, *args, **kwargs)
+        )
+
+        # Update the last seen time
+        tg_user.update_last_seen()
+
+        # Increment the request count
+        tg_user.increment_request_count()
+
+    def get_command_types(self, request: Request, *args, **kwargs) -> list[str]:
+        """TelegramCommand types recorded for a successful request."""
+        return [self.command_type]
+
+    @abstractmethod
+    def respond(self, request: Request, *args, **kwargs):
+        """Build the response for an allowed user."""
+        pass
+
+    @abstractmethod
+    def get_error_message(self, *args, **kwargs) -> str:
+        """Message returned when ``respond`` fails unexpectedly."""
+        pass
+
+
+def request_params(request: Request):
+    """Parameters of a market request: the query string on GET, the body on POST."""
+    return request.query_params if request.method == "GET" else request.data
+
+
+def split_param(value) -> list[str]:
+    """Read a list parameter given either as a list or comma-separated."""
+    if isinstance(value, str):
+        value = value.split(",")
+    return [str(item).strip() for item in value or [] if str(item).strip()]
+
+
+def get_selections(
+    params, categories: list[MarketCategory]
+) -> tuple[dict[str, Selection] | None, Response | None]:
+    """
+    Read ``fields`` and each category's row filter (``titles`` or ``symbols``).
+
+    A field is accepted if any of the requested categories has it.
+    """
+    fields = tuple(dict.fromkeys(split_param(params.get("fields"))))
+    available = list(dict.fromkeys(f for c in categories for f in c.fields))
+    unknown = [field for field in fields if field not in available]
+    if unknown:
+        return None, Response(
+            {
+                "message": f"Unknown fields: {', '.join(unknown)}.",
+                "available": available,
+            },
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+    return {
+        category.name: Selection(
+            category.key_field,
+            tuple(split_param(params.get(category.filter_param))),
+            fields,
+        )
+        for category in categories
+    }, None
+
+
+def get_since(params) -> tuple[int | None, Response | None]:
+    """Read the optional ``since`` generation of a change request."""
+    since = params.get("since")
+    if since is None or since == "":
+        return None, None
+    try:
+        since = int(since)
+    except (TypeError, ValueError):
+        since = -1
+    if since < 0:
+        return None, Response(
+            {"message": "since must be a non-negative generation number."},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+    return since, None
+
+
+class MarketDataView(MeteredView):
+    """
+    Serve the snapshot of one market category; subclasses set ``category``.
+
+    With ``since=<generation>`` only the instruments changed after that
+    generation are returned.
+    """
+
+    category: MarketCategory = None
+
+    http_method_names = ["get", "post"]
+
+    def get_serializer_class(self):
+        return self.category.serializer_class
+
+    def post(self, request: Request, *args, **kwargs):
+        return self.metered_response(request, request.data.get("user_id"))
+
+    def respond(self, request: Request):
+        category = self.category
+        params = request_params(request)
+
+        selections, error = get_selections(params, [category])
+        if error is not None:
+            return error
+
+        since, error = get_since(params)
+        if error is not None:
+            return error
+
+        # Read the cached snapshot
+        snapshot = SnapshotCache.instance().get(category.path)
+        if snapshot is None:
+            return Response(
+                {"message": category.not_found_message},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        # Answer conditional requests before the user is charged
+        not_modified = not_modified_response(request, snapshot)
+        if not_modified is not None:
+            return not_modified
+
+        if since is not None:
+            return changes_response(
+                request,
+                snapshot,
+                self.get_serializer_class(),
+                category.message,
+                category.changes_path,
+                since,
+                selections[category.name],
+            )
+
+        return snapshot_response(
+            request,
+            snapshot,
+            self.get_serializer_class(),
+            category.message,
+            selections[category.name],
+        )
+
+    def get_command_types(self, request: Request) -> list[str]:
+        return [self.category.name]
+
+    def get_error_message(self) -> str:
+        return self.category.error_message
+
+
+class MarketBatchView(MeteredView):
+    """
+    Serve several market categories in one response.
+
+    Categories come from ``?categories=coin,gold`` on GET or ``categories`` in
+    the body on POST. The user is checked once and charged a single request,
+    while one TelegramCommand is still recorded per category.
+    """
+
+    http_method_names = ["get", "post"]
+
+    def post(self, request: Request, *args, **kwargs):
+        return self.metered_response(request, request.data.get("user_id"))
+
+    def respond(self, request: Request):
+        params = request_params(request)
+
+        categories, error = self._get_categories(params.get("categories"))
+        if error is not None:
+            return error
+
+        selections, error = get_selections(params, categories)
+        if error is not None:
+            return error
+
+        # Read the cached snapshots
+        snapshots = []
+        for category in categories:
+            snapshot = SnapshotCache.instance().get(category.path)
+            if snapshot is None:
+                return Response(
+                    {"message": category.not_found_message},
+                    status=status.HTTP_404_NOT_FOUND,
+                )
+            snapshots.append(snapshot)
+
+        # Answer conditional requests before the user is charged
+        not_modified = not_modified_response(request, *snapshots)
+        if not_modified is not None:
+            return not_modified
+
+        return batch_response(
+            request,
+            [
+                (
+                    category.name,
+                    snapshot,
+                    category.serializer_class,
+                    category.message,
+                    selections[category.name],
+                )
+                for category, snapshot in zip(categories, snapshots)
+            ],
+            "Market data retrieved successfully.",
+        )
+
+    def get_command_types(self, request: Request) -> list[str]:
+        # One command per category, for a single counted request
+        categories, _ = self._get_categories(request_params(request).get("categories"))
+        return [category.name for category in categories]
+
+    def get_error_message(self) -> str:
+        return "Error retrieving market data"
+
+    def _get_categories(
+        self, names
+    ) -> tuple[list[MarketCategory] | None, Response | None]:
+        """Resolve the requested category names."""
+        names = split_param(names)
+        if not names:
+            return None, Response(
+                {"message": "Categories not provided."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        unknown = [name for name in names if name not in MARKET_CATEGORIES]
+        if unknown:
+            return None, Response(
+                {
+                    "message": f"Unknown categories: {', '.join(unknown)}.",
+                    "available": list(MARKET_CATEGORIES),
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        # Keep the requested order and drop repeats
+        return [MARKET_CATEGORIES[name] for name in dict.fromkeys(names)], None
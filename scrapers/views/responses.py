@@ -0,0 +1,494 @@
+import gzip
+import json
+import hashlib
+from typing import NamedTuple
+from django.conf import settings
+from django.http import HttpResponse
+from datetime import datetime, timezone
+from django.utils.cache import patch_vary_headers
+from django.utils.http import http_date, parse_etags, parse_http_date_safe
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.renderers import JSONRenderer
+from rest_framework.serializers import Serializer
+
+from scrapers.modules.snapshots import CachedSnapshot, merge_changes, read_changes
+
+try:
+    import brotli
+except ImportError:  # Optional dependency; gzip is always available
+    brotli = None
+
+COMPRESSORS = {"gzip": lambda body: gzip.compress(body, compresslevel=9, mtime=0)}
+if brotli is not None:
+    COMPRESSORS["br"] = lambda body: brotli.compress(body, quality=11)
+
+# Preferred encoding first when the client accepts several with the same weight
+ENCODING_PREFERENCE = ("br", "gzip")
+
+
+class Selection(NamedTuple):
+    """Rows (by key field) and fields a client asked for; empty means all."""
+
+    key_field: str
+    keys: tuple[str, ...] = ()
+    fields: tuple[str, ...] = ()
+
+    @property
+    def selects_all(self) -> bool:
+        return not self.keys and not self.fields
+
+
+def query_user_id(request) -> str | None:
+    """Telegram user ID of a GET request, from the X-Telegram-User-Id header or ?user_id=."""
+    return request.headers.get("X-Telegram-User-Id") or request.query_params.get(
+        "user_id"
+    )
+
+
+def build_payload(
+    snapshot: CachedSnapshot, serializer_class: type[Serializer], message: str
+) -> dict:
+    """Build the response envelope for a snapshot."""
+    serializer = serializer_class(snapshot.data, many=True)
+    return {
+        "data": serializer.data,
+        "retrieved_at": snapshot.data[0].get("last_update"),
+        "message": message,
+    }
+
+
+def snapshot_rows(
+    snapshot: CachedSnapshot, serializer_class: type[Serializer]
+) -> list[dict]:
+    """Serialize a snapshot's rows once per generation."""
+    return snapshot.artifact(
+        f"rows:{serializer_class.__name__}",
+        lambda s: serializer_class(s.data, many=True).data,
+    )
+
+
+def snapshot_index(snapshot: CachedSnapshot, key_field: str) -> dict[str, list[int]]:
+    """Map each case-folded ``key_field`` value to its row positions, once per generation."""
+
+    def build(s: CachedSnapshot) -> dict[str, list[int]]:
+        index = {}
+        for position, row in enumerate(s.data):
+            key = str(row.get(key_field, "")).strip().casefold()
+            index.setdefault(key, []).append(position)
+        return index
+
+    return snapshot.artifact(f"index:{key_field}", build)
+
+
+def select_rows(
+    rows: list[dict], selection: Selection, positions: list[int] | None = None
+) -> list[dict]:
+    """
+    Keep the rows and fields in ``selection``.
+
+    ``positions`` are the matching rows when already looked up in an index;
+    otherwise rows are matched on ``selection.key_field`` one by one.
+    """
+    if positions is not None:
+        rows = [rows[position] for position in positions]
+    elif selection.keys:
+        keys = {key.casefold() for key in selection.keys}
+        rows = [
+            row
+            for row in rows
+            if str(row.get(selection.key_field, "")).strip().casefold() in keys
+        ]
+
+    if selection.fields:
+        rows = [
+            {field: row[field] for field in selection.fields if field in row}
+            for row in rows
+        ]
+    return rows
+
+
+def build_selected_payload(
+    snapshot: CachedSnapshot,
+    serializer_class: type[Serializer],
+    message: str,
+    selection: Selection,
+) -> dict:
+    """Build the response envelope for the rows and fields in ``selection``."""
+    positions = None
+    if selection.keys:
+        index = snapshot_index(snapshot, selection.key_field)
+        positions = sorted(
+            {
+                position
+                for key in selection.keys
+                for position in index.get(key.casefold(), ())
+            }
+        )
+
+    return {
+        "data": select_rows(
+            snapshot_rows(snapshot, serializer_class), selection, positions
+        ),
+        "retrieved_at": snapshot.data[0].get("last_update"),
+        "message": message,
+    }
+
+
+def snapshot_changes(
+    snapshot: CachedSnapshot, changes_path: str
+) -> tuple[list[dict], int]:
+    """
+    Read a category's change log once per generation.
+
+    Returns the entries up to the snapshot's generation and the oldest
+    generation they can bring a client forward from.
+    """
+
+    def build(s: CachedSnapshot) -> tuple[list[dict], int]:
+        entries = [
+            entry
+            for entry in read_changes(changes_path)
+            if entry["generation"] <= s.generation
+        ]
+        oldest = s.generation
+        for entry in reversed(entries):
+            if entry["generation"] != oldest:
+                break
+            oldest -= 1
+        return entries, oldest
+
+    return snapshot.artifact("changes", build)
+
+
+def build_changes_payload(
+    snapshot: CachedSnapshot,
+    serializer_class: type[Serializer],
+    message: str,
+    changes_path: str,
+    since: int,
+    selection: Selection,
+) -> dict:
+    """
+    Build the envelope of the instruments changed since generation ``since``.
+
+    ``data`` holds the added or changed rows and ``removed`` the keys of the
+    dropped ones. When the change log no longer reaches back to ``since``,
+    ``full`` is true and ``data`` holds every row instead.
+    """
+    entries, oldest = snapshot_changes(snapshot, changes_path)
+
+    if oldest <= since <= snapshot.generation:
+        rows, removed = merge_changes(
+            entries, since, snapshot.generation, selection.key_field
+        )
+        rows = select_rows(serializer_class(rows, many=True).data, selection)
+        if selection.keys:
+            keys = {key.casefold() for key in selection.keys}
+            removed = [key for key in removed if str(key).casefold() in keys]
+        full = False
+    else:
+        rows = build_selected_payload(snapshot, serializer_class, message, selection)[
+            "data"
+        ]
+        removed, full = [], True
+
+    return {
+        "data": rows,
+        "removed": removed,
+        "full": full,
+        "generation": snapshot.generation,
+        "retrieved_at": snapshot.data[0].get("last_update"),
+        "message": message,
+    }
+
+
+def render_body(
+    snapshot: CachedSnapshot, serializer_class: type[Serializer], message: str
+) -> bytes:
+    """Render the response body once per snapshot generation."""
+    return render_variants(snapshot, serializer_class, message)[None]
+
+
+def render_variants(
+    snapshot: CachedSnapshot, serializer_class: type[Serializer], message: str
+) -> dict[str | None, bytes]:
+    """
+    Render the response body and all of its compressed variants once per
+    snapshot generation, keyed by content coding (None for identity).
+    """
+
+    def build(s: CachedSnapshot) -> dict[str | None, bytes]:
+        body = JSONRenderer().render(build_payload(s, serializer_class, message))
+        variants = {None: body}
+        if settings.SCRAPER_COMPRESSED_RESPONSES:
+            for encoding, compress in COMPRESSORS.items():
+                variants[encoding] = compress(body)
+        return variants
+
+    return snapshot.artifact(f"body:{serializer_class.__name__}:{message}", build)
+
+
+def choose_encoding(accept_encoding: str, available) -> str | None:
+    """Pick the best available content coding allowed by an Accept-Encoding header."""
+    weights = {}
+    for part in accept_encoding.split(","):
+        coding, _, params = part.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        weight = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                weight = float(params[2:])
+            except ValueError:
+                weight = 0.0
+        weights[coding] = weight
+
+    best, best_weight = None, 0.0
+    for coding in ENCODING_PREFERENCE:
+        if coding not in available:
+            continue
+        weight = weights.get(coding, weights.get("*", 0.0))
+        if weight > best_weight:
+            best, best_weight = coding, weight
+    return best
+
+
+def snapshot_etag(snapshot: CachedSnapshot) -> str:
+    """
+    Weak ETag for a snapshot, derived from its generation and a hash of its rows.
+
+    Weak because the same snapshot is served in several content codings.
+    """
+
+    def build(s: CachedSnapshot) -> str:
+        rows = json.dumps(s.data, ensure_ascii=False, sort_keys=True)
+        digest = hashlib.sha256(rows.encode("utf-8")).hexdigest()[:16]
+        return f'W/"{s.generation}-{digest}"'
+
+    return snapshot.artifact("etag", build)
+
+
+def snapshot_last_modified(snapshot: CachedSnapshot) -> int:
+    """Unix timestamp of the scrape behind a snapshot, falling back to its file mtime."""
+
+    def build(s: CachedSnapshot) -> int:
+        scraped_at = s.meta.get("scraped_at")
+        if scraped_at:
+            try:
+                return int(datetime.fromisoformat(scraped_at).timestamp())
+            except ValueError:
+                pass
+        return s.mtime_ns // 1_000_000_000
+
+    return snapshot.artifact("last_modified", build)
+
+
+def snapshot_max_age(snapshot: CachedSnapshot) -> int:
+    """Seconds until the next scheduled scrape is expected to replace a snapshot."""
+    interval = settings.SCRAPER_INTERVAL_MINUTES * 60
+    age = datetime.now(timezone.utc).timestamp() - snapshot_last_modified(snapshot)
+    return int(min(interval, max(0, interval - age)))
+
+
+def snapshots_etag(*snapshots: CachedSnapshot) -> str:
+    """ETag of a single snapshot, or a combined weak ETag for several."""
+    if len(snapshots) == 1:
+        return snapshot_etag(snapshots[0])
+    etags = ",".join(snapshot_etag(s) for s in snapshots)
+    return f'W/"{hashlib.sha256(etags.encode("utf-8")).hexdigest()[:16]}"'
+
+
+def patch_snapshot_headers(request, response: HttpResponse, *snapshots: CachedSnapshot):
+    """
+    Add the snapshots' validators, plus shared-cache headers on GET requests.
+
+    GET responses are marked public and stay fresh until the next scrape is
+    due, so a proxy or CDN can absorb repeated polling. They vary on the API
+    key and the Telegram user header, so a shared cache only replays a body
+    to the same key and user. The trade-off is that those replays never reach
+    the view, so they are not counted against the Telegram user's quota. The
+    ``user_id`` query parameter is part of the URL and keyed the same way.
+    """
+    last_modified = max(snapshot_last_modified(s) for s in snapshots)
+    response["ETag"] = snapshots_etag(*snapshots)
+    response["Last-Modified"] = http_date(last_modified)
+    if request.method == "GET":
+        max_age = min(snapshot_max_age(s) for s in snapshots)
+        response["Cache-Control"] = f"public, max-age={max_age}"
+    patch_vary_headers(
+        response, ("Accept-Encoding", "Authorization", "X-Telegram-User-Id")
+    )
+
+
+def not_modified_response(request, *snapshots: CachedSnapshot) -> HttpResponse | None:
+    """
+    Return a 304 response if the client already holds these snapshots, else None.
+
+    If-None-Match takes precedence; If-Modified-Since is only honoured on GET.
+    """
+    if_none_match = request.headers.get("If-None-Match")
+    if_modified_since = request.headers.get("If-Modified-Since")
+
+    if if_none_match:
+        etag = snapshots_etag(*snapshots)
+        client_etags = parse_etags(if_none_match)
+        if "*" not in client_etags and _weak(etag) not in map(_weak, client_etags):
+            return None
+    elif if_modified_since and request.method == "GET":
+        since = parse_http_date_safe(if_modified_since)
+        last_modified = max(snapshot_last_modified(s) for s in snapshots)
+        if since is None or last_modified > since:
+            return None
+    else:
+        return None
+
+    response = HttpResponse(status=status.HTTP_304_NOT_MODIFIED)
+    patch_snapshot_headers(request, response, *snapshots)
+    return response
+
+
+def _weak(etag: str) -> str:
+    return etag[2:] if etag.startswith("W/") else etag
+
+
+def snapshot_response(
+    request,
+    snapshot: CachedSnapshot,
+    serializer_class: type[Serializer],
+    message: str,
+    selection: Selection | None = None,
+) -> HttpResponse | Response:
+    """
+    Respond with a snapshot's data, or only the rows and fields in ``selection``.
+
+    With SCRAPER_PRESERIALIZED_RESPONSES the body rendered for the current
+    generation is served as raw bytes, in the best precompressed variant the
+    client accepts; otherwise it is serialized per request. All variants
+    decode to the same JSON document and carry the snapshot's cache headers.
+    Selections are looked up in the per-generation index and built per request.
+    """
+    if selection is not None and not selection.selects_all:
+        response = Response(
+            build_selected_payload(snapshot, serializer_class, message, selection),
+            status=status.HTTP_200_OK,
+        )
+        patch_snapshot_headers(request, response, snapshot)
+        return response
+
+    if not settings.SCRAPER_PRESERIALIZED_RESPONSES:
+        response = Response(
+            build_payload(snapshot, serializer_class, message),
+            status=status.HTTP_200_OK,
+        )
+        patch_snapshot_headers(request, response, snapshot)
+        return response
+
+    variants = render_variants(snapshot, serializer_class, message)
+    encoding = choose_encoding(request.headers.get("Accept-Encoding", ""), variants)
+
+    response = HttpResponse(
+        variants[encoding],
+        content_type="application/json",
+        status=status.HTTP_200_OK,
+    )
+    if encoding is not None:
+        response["Content-Encoding"] = encoding
+    patch_snapshot_headers(request, response, snapshot)
+    return response
+
+
+def batch_response(
+    request,
+    parts: list[tuple[str, CachedSnapshot, type[Serializer], str, Selection | None]],
+    message: str,
+) -> HttpResponse | Response:
+    """
+    Respond with several snapshots at once, keyed by category.
+
+    Each part is ``(key, snapshot, serializer_class, message, selection)`` and
+    appears in ``results`` exactly as its single-category endpoint would return
+    it. With SCRAPER_PRESERIALIZED_RESPONSES the per-generation bodies are
+    spliced together as bytes; combinations are not precompressed.
+    """
+    snapshots = [part[1] for part in parts]
+
+    def payload(snapshot, serializer_class, part_message, selection) -> dict:
+        if selection is None or selection.selects_all:
+            return build_payload(snapshot, serializer_class, part_message)
+        return build_selected_payload(
+            snapshot, serializer_class, part_message, selection
+        )
+
+    if not settings.SCRAPER_PRESERIALIZED_RESPONSES:
+        results = {key: payload(*rest) for key, *rest in parts}
+        response = Response(
+            {"results": results, "message": message}, status=status.HTTP_200_OK
+        )
+        patch_snapshot_headers(request, response, *snapshots)
+        return response
+
+    renderer = JSONRenderer()
+
+    def render_part(snapshot, serializer_class, part_message, selection) -> bytes:
+        if selection is None or selection.selects_all:
+            return render_body(snapshot, serializer_class, part_message)
+        return renderer.render(
+            payload(snapshot, serializer_class, part_message, selection)
+        )
+
+    results = b",".join(
+        renderer.render(key) + b":" + render_part(*rest) for key, *rest in parts
+    )
+    body = b'{"results":{' + results + b'},"message":' + renderer.render(message) + b"}"
+
+    response = HttpResponse(
+        body, content_type="application/json", status=status.HTTP_200_OK
+    )
+    patch_snapshot_headers(request, response, *snapshots)
+    return response
+
+
+def changes_response(
+    request,
+    snapshot: CachedSnapshot,
+    serializer_class: type[Serializer],
+    message: str,
+    changes_path: str,
+    since: int,
+    selection: Selection,
+) -> HttpResponse | Response:
+    """
+    Respond with the instruments changed since generation ``since``.
+
+    Without a selection the body is rendered once per generation for each
+    ``since`` the change log covers, plus once for the full fallback.
+    """
+    if not settings.SCRAPER_PRESERIALIZED_RESPONSES or not selection.selects_all:
+        response = Response(
+            build_changes_payload(
+                snapshot, serializer_class, message, changes_path, since, selection
+            ),
+            status=status.HTTP_200_OK,
+        )
+        patch_snapshot_headers(request, response, snapshot)
+        return response
+
+    _, oldest = snapshot_changes(snapshot, changes_path)
+    window = since if oldest <= since <= snapshot.generation else "full"
+    body = snapshot.artifact(
+        f"changes:{serializer_class.__name__}:{message}:{window}",
+        lambda s: JSONRenderer().render(
+            build_changes_payload(
+                s, serializer_class, message, changes_path, since, selection
+            )
+        ),
+    )
+
+    response = HttpResponse(
+        body, content_type="application/json", status=status.HTTP_200_OK
+    )
+    patch_snapshot_headers(request, response, snapshot)
+    return response
@@ -0,0 +1,151 @@
+import asyncio
+from django.views import View
+from django.conf import settings
+from asgiref.sync import sync_to_async
+from contextlib import suppress
+from django.http import JsonResponse, StreamingHttpResponse
+from rest_framework import status
+from rest_framework.renderers import JSONRenderer
+from rest_framework.exceptions import AuthenticationFailed
+
+from scrapers.views.responses import render_body
+from scrapers.views.market_views import get_requesting_user
+from scrapers.views.categories import MARKET_CATEGORIES, MarketCategory
+from scrapers.modules.snapshots import CachedSnapshot, SnapshotFeed, compute_delta
+from api_keys.authentication import APIKeyAuthentication
+from telegram.models import TelegramCommand
+
+STREAM_MODES = ("delta", "snapshot")
+
+
+def snapshot_event(snapshot: CachedSnapshot, category: MarketCategory) -> bytes:
+    """SSE event carrying a full snapshot, rendered once per generation."""
+
+    def build(s: CachedSnapshot) -> bytes:
+        body = render_body(s, category.serializer_class, category.message)
+        return b"event: snapshot\nid: %d\ndata: %s\n\n" % (s.generation, body)
+
+    return snapshot.artifact(f"sse:snapshot:{category.name}", build)
+
+
+def delta_event(
+    previous: CachedSnapshot, snapshot: CachedSnapshot, category: MarketCategory
+) -> bytes:
+    """SSE event carrying the instruments changed since ``previous``."""
+
+    def build(s: CachedSnapshot) -> bytes:
+        delta = compute_delta(previous.data, s.data, category.key_field)
+        serializer_class = category.serializer_class
+        payload = {
+            "generation": s.generation,
+            "previous_generation": previous.generation,
+            "added": serializer_class(delta.added, many=True).data,
+            "changed": serializer_class(delta.changed, many=True).data,
+            "removed": delta.removed,
+            "retrieved_at": s.data[0].get("last_update"),
+        }
+        body = JSONRenderer().render(payload)
+        return b"event: delta\nid: %d\ndata: %s\n\n" % (s.generation, body)
+
+    return snapshot.artifact(f"sse:delta:{category.name}:{previous.generation}", build)
+
+
+class MarketStreamView(View):
+    """
+    Stream a market category as Server-Sent Events.
+
+    Clients first get a ``snapshot`` event, then one event per published
+    generation: a ``delta`` against the last generation they were sent, or
+    another full ``snapshot`` with ``?mode=snapshot``. Slow clients skip to
+    the latest generation, and a reconnecting client whose Last-Event-ID is
+    the current generation skips the initial snapshot.
+
+    Each connection counts as one request against the Telegram user's quota.
+    Serve it over ASGI (uvicorn): under WSGI each open connection holds a
+    sync worker until the client disconnects.
+    """
+
+    http_method_names = ["get"]
+
+    async def get(self, request, category: str, *args, **kwargs):
+        market_category = MARKET_CATEGORIES.get(category)
+        if market_category is None:
+            return JsonResponse(
+                {"message": f"Unknown category: {category}."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        mode = request.GET.get("mode", "delta")
+        if mode not in STREAM_MODES:
+            return JsonResponse(
+                {"message": f"Mode must be one of: {', '.join(STREAM_MODES)}."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        error = await sync_to_async(self._authorize)(request, market_category)
+        if error is not None:
+            return error
+
+        response = StreamingHttpResponse(
+            self._events(request, market_category, mode),
+            content_type="text/event-stream",
+        )
+        response["Cache-Control"] = "no-cache"
+        response["X-Accel-Buffering"] = "no"  # Keep nginx from buffering events
+        return response
+
+    def _authorize(self, request, category: MarketCategory) -> JsonResponse | None:
+        """Check the API key and Telegram user, and record the subscription."""
+        try:
+            APIKeyAuthentication().authenticate(request)
+        except AuthenticationFailed as e:
+            return JsonResponse({"detail": e.detail}, status=e.status_code)
+
+        tg_user_id = request.headers.get("X-Telegram-User-Id") or request.GET.get(
+            "user_id"
+        )
+        tg_user, error = get_requesting_user(tg_user_id)
+        if error is not None:
+            return JsonResponse(error.data, status=error.status_code)
+
+        # Create a command for the user
+        TelegramCommand.objects.create(tg_user=tg_user, command_type=category.name)
+
+        # Update the last seen time
+        tg_user.update_last_seen()
+
+        # Increment the request count
+        tg_user.increment_request_count()
+        return None
+
+    async def _events(self, request, category: MarketCategory, mode: str):
+        last_event_id = request.headers.get("Last-Event-ID")
+        heartbeat = settings.SCRAPER_STREAM_HEARTBEAT
+
+        updates = SnapshotFeed.for_path(category.path).updates()
+        next_update = asyncio.ensure_future(anext(updates))
+        sent = None
+        try:
+            while True:
+                done, _ = await asyncio.wait({next_update}, timeout=heartbeat)
+                if not done:
+                    yield b": keep-alive\n\n"
+                    continue
+
+                snapshot = next_update.result()
+                next_update = asyncio.ensure_future(anext(updates))
+
+                if sent is None and last_event_id == str(snapshot.generation):
+                    sent = snapshot  # Client already holds this generation
+                    continue
+
+                if mode == "delta" and sent is not None:
+                    yield delta_event(sent, snapshot, category)
+                else:
+                    yield snapshot_event(snapshot, category)
+                sent = snapshot
+        finally:
+            next_update.cancel()
+            with suppress(asyncio.CancelledError, StopAsyncIteration):
+                await next_update
+            await updates.aclose()
@@ -0,0 +1,28 @@
+# Generated by Django 5.2 on 2026-10-18 12:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("telegram", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="telegramcommand",
+            name="command_type",
+            field=models.CharField(
+                choices=[
+                    ("coin", "Coin"),
+                    ("gold", "Gold"),
+                    ("crypto", "Crypto"),
+                    ("currency", "Currency"),
+                    ("rates", "Derived Rates"),
+                ],
+                db_index=True,
+                max_length=10,
+            ),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.2 on 2026-10-18 12:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("telegram", "0002_alter_telegramcommand_command_type"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="telegramcommand",
+            name="command_type",
+            field=models.CharField(
+                choices=[
+                    ("coin", "Coin"),
+                    ("gold", "Gold"),
+                    ("crypto", "Crypto"),
+                    ("currency", "Currency"),
+                    ("rates", "Derived Rates"),
+                    ("convert", "Conversion"),
+                    ("candles", "Candles"),
+                    ("history", "Price History"),
+                    ("export", "History Export"),
+                ],
+                db_index=True,
+                max_length=10,
+            ),
+        ),
+    ]
@@ -9,6 +9,11 @@ class TelegramCommand(models.Model):
         ("gold", "Gold"),
         ("crypto", "Crypto"),
         ("currency", "Currency"),
+        ("rates", "Derived Rates"),
+        ("convert", "Conversion"),
+        ("candles", "Candles"),
+        ("history", "Price History"),
+        ("export", "History Export"),
     ]
 
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)